@@ -13,6 +13,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on pooled HTTPS connections shared by all clients
+MAX_CONNECTIONS = 32
+
+# Shared by every client so concurrent transfers reuse open connections;
+# create_session keeps the SDK's certificate pinning
+_SESSION = dropbox.create_session(max_connections=MAX_CONNECTIONS)
+
 
 def rate_limit(max_attempts: int = 3, cooldown: int = 300):
     """Rate limiting decorator for authentication attempts."""
@@ -204,6 +211,7 @@ class Authenticator:
             - Automatically handles token refresh
             - Validates connection by checking account access
             - Returns None if authentication fails
+            - Clients share one pooled HTTP session (MAX_CONNECTIONS)
         """
         credentials = self.storage.get_tokens()
         if not credentials:
@@ -214,6 +222,7 @@ class Authenticator:
                 "oauth2_refresh_token": credentials["refresh_token"],
                 "app_key": credentials["app_key"],
                 "app_secret": credentials["app_secret"],
+                "session": _SESSION,
             }
             if credentials.get("access_token"):
                 kwargs["oauth2_access_token"] = credentials["access_token"]
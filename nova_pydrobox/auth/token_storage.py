@@ -45,6 +45,7 @@ class TokenStorage:
     ):
         self.service_name = service_name
         self.token_lifetime = token_lifetime or self.DEFAULT_TOKEN_LIFETIME
+        self._fernet: Optional[Fernet] = None
         # Allow force_fernet to override platform check for testing
         if force_fernet is not None:
             self.use_keyring = not force_fernet
@@ -114,6 +115,20 @@ class TokenStorage:
             logger.error(f"Error handling encryption key: {e}")
             raise
 
+    def _get_fernet(self) -> Fernet:
+        """
+        Get the Fernet instance for this storage, creating it on first use.
+
+        Returns:
+            Fernet: Fernet instance bound to the stored encryption key
+
+        Note:
+            The key file is read once per TokenStorage instance
+        """
+        if self._fernet is None:
+            self._fernet = Fernet(self._get_or_create_encryption_key())
+        return self._fernet
+
     def _encode_value(self, value: any) -> str:
         """
         Encode a value using base64.
@@ -264,8 +279,7 @@ class TokenStorage:
             Encrypts tokens and saves to .tokens.encrypted file
         """
         try:
-            key = self._get_or_create_encryption_key()
-            f = Fernet(key)
+            f = self._get_fernet()
             token_data = json.dumps(tokens).encode()
             encrypted_data = f.encrypt(token_data)
             token_path = self._get_token_path()
@@ -297,11 +311,8 @@ class TokenStorage:
                 logger.debug("Token file does not exist")
                 return None
 
-            key = self._get_or_create_encryption_key()
-            logger.debug(f"Got encryption key: {key[:10]}...")
-
-            f = Fernet(key)
-            logger.debug("Created Fernet instance")
+            f = self._get_fernet()
+            logger.debug("Got Fernet instance")
 
             encrypted_data = token_path.read_bytes()
             logger.debug(f"Read encrypted data: {encrypted_data[:20]}...")
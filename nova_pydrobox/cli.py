@@ -18,6 +18,22 @@ from nova_pydrobox.auth import Authenticator
 from nova_pydrobox.operations import FolderOperations
 
 
+def _normalize_path(path: str) -> str:
+    """
+    Normalize a Dropbox folder path given on the command line.
+
+    Args:
+        path (str): Folder path as typed by the user
+
+    Returns:
+        str: Path without trailing slashes ('/' for the root)
+
+    Note:
+        ``/Photos/`` and ``/Photos`` refer to the same folder
+    """
+    return path.rstrip("/") or "/"
+
+
 @click.group()
 def cli():
     """
@@ -84,6 +100,7 @@ def list_files(path):
         List specific folder:
         $ nova-pydrobox list-files /Documents
     """
+    path = _normalize_path(path)
     ops = FolderOperations()
     files = ops.list_files(path)
 
@@ -2,11 +2,17 @@
 
 import hashlib
 import logging
+import operator
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import reduce
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterable, Optional, Tuple, Union
 
 import dropbox
 import pandas as pd
@@ -15,12 +21,27 @@ from dropbox.files import (  # Add FileStatus
     FileStatus,
     FolderMetadata,
     ListFolderResult,
+    Metadata,
 )
 
 from nova_pydrobox.auth.authenticator import get_dropbox_client
 
 logger = logging.getLogger(__name__)
 
+# Column order of metadata DataFrames returned by operations
+_METADATA_COLUMNS = ("name", "path", "type", "size", "modified", "hash")
+
+# Column dtypes for listing DataFrames; other columns stay object
+_METADATA_DTYPES = {
+    "type": pd.CategoricalDtype(["file", "folder"]),
+    "size": "int64",
+}
+
+
+def _cache_key(path: str) -> str:
+    """Normalize a Dropbox path for metadata cache lookups (case-insensitive)."""
+    return path.lower().rstrip("/")
+
 
 class FileType(Enum):
     """
@@ -60,6 +81,37 @@ class FileFilter:
     max_size: Optional[int] = None
     recursive: bool = False
 
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Filter a metadata DataFrame by these criteria.
+
+        Args:
+            df (pd.DataFrame): DataFrame with 'type' and 'size' columns
+
+        Returns:
+            pd.DataFrame: Rows matching every criterion
+
+        Note:
+            Criteria are evaluated on the underlying numpy arrays and
+            combined into one boolean mask, so the frame is indexed once
+            regardless of how many criteria are set. With no criteria
+            the frame is returned as-is.
+        """
+        if df.empty:
+            return df
+        conditions = []
+        if self.file_type != FileType.ALL:
+            conditions.append((df["type"] == self.file_type.value).to_numpy())
+        if self.min_size or self.max_size:
+            sizes = df["size"].to_numpy()
+            if self.min_size:
+                conditions.append(sizes >= self.min_size)
+            if self.max_size:
+                conditions.append(sizes <= self.max_size)
+        if not conditions:
+            return df
+        return df[reduce(operator.and_, conditions)]
+
 
 class BaseOperations:
     """
@@ -73,11 +125,18 @@ class BaseOperations:
 
     Attributes:
         CHUNK_SIZE (int): Size of chunks for file operations (4MB)
+        LIST_FOLDER_LIMIT (int): Maximum entries requested per listing page
+        METADATA_CACHE_TTL (float): Seconds a cached metadata lookup stays valid
+        METADATA_CACHE_SIZE (int): Maximum cached metadata lookups; the least
+            recently used entry is evicted beyond this
         dbx (dropbox.Dropbox): Authenticated Dropbox client
         max_workers (int): Maximum number of concurrent operations
     """
 
     CHUNK_SIZE = 4 * 1024 * 1024
+    LIST_FOLDER_LIMIT = 2000
+    METADATA_CACHE_TTL = 30.0
+    METADATA_CACHE_SIZE = 1024
 
     def __init__(self, max_workers: int = 4, dbx_client=None):
         """
@@ -90,10 +149,63 @@ class BaseOperations:
         Raises:
             ConnectionError: If Dropbox client initialization fails
         """
-        self.dbx = dbx_client if dbx_client else get_dropbox_client()
-        if not self.dbx:
+        self.dbx = dbx_client if dbx_client is not None else get_dropbox_client()
+        if self.dbx is None:
             raise ConnectionError("Could not initialize Dropbox client")
         self.max_workers = max_workers
+        self._meta_cache: OrderedDict[str, Tuple[float, Metadata]] = OrderedDict()
+        self._meta_lock = threading.Lock()
+
+    def _get_metadata_cached(self, path: str, ttl: Optional[float] = None) -> Metadata:
+        """
+        Get metadata for a Dropbox path, reusing recent lookups.
+
+        Args:
+            path (str): Dropbox path
+            ttl (Optional[float]): Maximum age of a cached entry in seconds.
+                Defaults to METADATA_CACHE_TTL.
+
+        Returns:
+            Metadata: Dropbox metadata for the path
+
+        Raises:
+            dropbox.exceptions.ApiError: If the metadata request fails
+
+        Note:
+            - Entries are dropped by write operations through this instance;
+              changes made elsewhere are visible once the TTL expires
+            - At most METADATA_CACHE_SIZE entries are kept, evicting the
+              least recently used
+        """
+        ttl = self.METADATA_CACHE_TTL if ttl is None else ttl
+        key = _cache_key(path)
+        now = time.monotonic()
+        with self._meta_lock:
+            cached = self._meta_cache.get(key)
+            if cached is not None and now - cached[0] < ttl:
+                self._meta_cache.move_to_end(key)
+                return cached[1]
+        metadata = self.dbx.files_get_metadata(path)
+        with self._meta_lock:
+            self._meta_cache[key] = (now, metadata)
+            self._meta_cache.move_to_end(key)
+            while len(self._meta_cache) > self.METADATA_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+        return metadata
+
+    def _invalidate_metadata(self, *paths: str) -> None:
+        """
+        Drop cached metadata for paths and everything beneath them.
+
+        Args:
+            *paths (str): Dropbox paths that were written to
+        """
+        with self._meta_lock:
+            for path in paths:
+                key = _cache_key(path)
+                for cached in list(self._meta_cache):
+                    if cached == key or cached.startswith(key + "/"):
+                        self._meta_cache.pop(cached, None)
 
     def _calculate_file_hash(self, file_path: str) -> str:
         """
@@ -106,14 +218,40 @@ class BaseOperations:
             str: Hexadecimal representation of the SHA256 hash
 
         Note:
-            Uses chunked reading for memory efficiency
+            Uses hashlib.file_digest on Python 3.11+, falling back to
+            chunked reading on older versions
         """
-        hasher = hashlib.sha256()
         with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            hasher = hashlib.sha256()
             for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
                 hasher.update(chunk)
         return hasher.hexdigest()
 
+    def _metadata_tuple(self, metadata: Union[FileMetadata, FolderMetadata]) -> tuple:
+        """
+        Convert Dropbox metadata into a row of standardized values.
+
+        Args:
+            metadata (Union[FileMetadata, FolderMetadata]): Dropbox metadata object
+
+        Returns:
+            tuple: Values in the order of the metadata columns
+                (name, path, type, size, modified, hash)
+        """
+        modified = getattr(metadata, "client_modified", None)
+        if isinstance(modified, datetime):
+            modified = modified.isoformat().replace("+00:00", "Z")
+        return (
+            metadata.name,
+            metadata.path_lower,
+            "folder" if isinstance(metadata, FolderMetadata) else "file",
+            getattr(metadata, "size", 0) if isinstance(metadata, FileMetadata) else 0,
+            modified,
+            getattr(metadata, "content_hash", None),
+        )
+
     def _process_metadata(self, metadata: Union[FileMetadata, FolderMetadata]) -> dict:
         """
         Process Dropbox metadata into standardized format.
@@ -130,19 +268,27 @@ class BaseOperations:
                 - modified: ISO 8601 timestamp
                 - hash: Content hash (files only)
         """
-        modified = getattr(metadata, "client_modified", None)
-        if isinstance(modified, datetime):
-            modified = modified.isoformat().replace("+00:00", "Z")
-        return {
-            "name": metadata.name,
-            "path": metadata.path_lower,
-            "type": "folder" if isinstance(metadata, FolderMetadata) else "file",
-            "size": getattr(metadata, "size", 0)
-            if isinstance(metadata, FileMetadata)
-            else 0,
-            "modified": modified,
-            "hash": getattr(metadata, "content_hash", None),
-        }
+        return dict(zip(_METADATA_COLUMNS, self._metadata_tuple(metadata)))
+
+    def _process_metadata_batch(self, entries: Iterable[Metadata]) -> pd.DataFrame:
+        """
+        Convert several Dropbox metadata objects into one DataFrame.
+
+        Args:
+            entries (Iterable[Metadata]): Dropbox metadata objects
+
+        Returns:
+            pd.DataFrame: DataFrame with one row per entry
+
+        Note:
+            - Builds the frame from row tuples in a single pass; no entries
+              still yields the standard columns
+            - 'type' is categorical and 'size' is int64
+        """
+        return pd.DataFrame.from_records(
+            [self._metadata_tuple(entry) for entry in entries],
+            columns=_METADATA_COLUMNS,
+        ).astype(_METADATA_DTYPES)
 
     def _process_listing_result(self, result: ListFolderResult) -> pd.DataFrame:
         """
@@ -154,11 +300,7 @@ class BaseOperations:
         Returns:
             pd.DataFrame: DataFrame containing file/folder metadata
         """
-        entries: List[dict] = []
-        for entry in result.entries:
-            entry_dict = self._process_metadata(entry)
-            entries.append(entry_dict)
-        return pd.DataFrame(entries)
+        return self._process_metadata_batch(result.entries)
 
     def list_files(
         self, path: str = "", filter_criteria: Optional[FileFilter] = None
@@ -176,6 +318,10 @@ class BaseOperations:
         Raises:
             dropbox.exceptions.ApiError: If Dropbox API request fails
 
+        Note:
+            The next page is fetched in the background while the current
+            one is converted to a DataFrame
+
         Example:
             ```python
             # List all files recursively
@@ -189,34 +335,32 @@ class BaseOperations:
             if path == "/":
                 path = ""  # Dropbox API requires root as empty string
 
-            has_more = True
-            cursor = None
             all_entries = []
-
-            while has_more:
-                if cursor:
-                    result = self.dbx.files_list_folder_continue(cursor)
-                else:
-                    result = self.dbx.files_list_folder(
-                        path,
-                        recursive=filter_criteria.recursive
-                        if filter_criteria
-                        else False,
+            result = self.dbx.files_list_folder(
+                path,
+                recursive=filter_criteria.recursive if filter_criteria else False,
+                limit=self.LIST_FOLDER_LIMIT,
+            )
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                while True:
+                    next_page = (
+                        executor.submit(
+                            self.dbx.files_list_folder_continue, result.cursor
+                        )
+                        if result.has_more
+                        else None
                     )
 
-                df = self._process_listing_result(result)
+                    df = self._process_listing_result(result)
 
-                if filter_criteria:
-                    if filter_criteria.file_type != FileType.ALL:
-                        df = df[df["type"] == filter_criteria.file_type.value]
-                    if filter_criteria.min_size:
-                        df = df[df["size"] >= filter_criteria.min_size]
-                    if filter_criteria.max_size:
-                        df = df[df["size"] <= filter_criteria.max_size]
-
-                all_entries.append(df)
-                has_more = result.has_more
-                cursor = result.cursor
+                    if filter_criteria:
+                        df = filter_criteria.apply(df)
+
+                    all_entries.append(df)
+                    if next_page is None:
+                        break
+                    result = next_page.result()
 
             return pd.concat(all_entries, ignore_index=True)
 
@@ -239,6 +383,7 @@ class BaseOperations:
         """
         try:
             self.dbx.files_delete_v2(path)
+            self._invalidate_metadata(path)
             logger.info(f"Successfully deleted {path}")
             return True
         except dropbox.exceptions.ApiError as e:
@@ -266,6 +411,7 @@ class BaseOperations:
             metadata = self.dbx.files_move_v2(
                 from_path, to_path, allow_shared_folder=True, autorename=True
             ).metadata
+            self._invalidate_metadata(from_path, to_path)
             result = self._process_metadata(metadata)
             return pd.DataFrame([result])
         except dropbox.exceptions.ApiError as e:
@@ -293,6 +439,7 @@ class BaseOperations:
             metadata = self.dbx.files_copy_v2(
                 from_path, to_path, allow_shared_folder=True, autorename=True
             ).metadata
+            self._invalidate_metadata(to_path)
             result = self._process_metadata(metadata)
             return pd.DataFrame([result])
         except dropbox.exceptions.ApiError as e:
@@ -322,6 +469,7 @@ class BaseOperations:
             metadata = self.dbx.files_move_v2(
                 from_path, to_path, allow_shared_folder=True, autorename=True
             ).metadata
+            self._invalidate_metadata(from_path, to_path)
             result = self._process_metadata(metadata)
             return pd.DataFrame([result])
         except dropbox.exceptions.ApiError as e:
@@ -370,16 +518,12 @@ class BaseOperations:
                         ),
                     )
 
-                entries = [match.metadata for match in result.matches]
-                df = pd.DataFrame([self._process_metadata(entry) for entry in entries])
+                df = self._process_metadata_batch(
+                    match.metadata for match in result.matches
+                )
 
                 if filter_criteria:
-                    if filter_criteria.file_type != FileType.ALL:
-                        df = df[df["type"] == filter_criteria.file_type.value]
-                    if filter_criteria.min_size:
-                        df = df[df["size"] >= filter_criteria.min_size]
-                    if filter_criteria.max_size:
-                        df = df[df["size"] <= filter_criteria.max_size]
+                    df = filter_criteria.apply(df)
 
                 matches.append(df)
                 has_more = result.has_more
@@ -2,18 +2,106 @@
 
 import hashlib
 import logging
+import os
+import posixpath
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import dropbox
 import pandas as pd
 from dropbox.files import FileMetadata, WriteMode
 from tqdm import tqdm
 
+from nova_pydrobox.config import Config
+from nova_pydrobox.exceptions import UploadError
 from nova_pydrobox.operations.base import BaseOperations
 
 logger = logging.getLogger(__name__)
 
+# Block size of the Dropbox content hash algorithm
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+class _ContentHasher:
+    """
+    Incremental Dropbox content hash.
+
+    The hash is the SHA256 of the concatenated SHA256 digests of each
+    4MB block of the file, so it can be computed from the chunks an
+    upload already reads.
+    """
+
+    def __init__(self):
+        self._digests: List[bytes] = []
+        self._block = hashlib.sha256()
+        self._block_len = 0
+
+    def update(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            take = min(len(view), HASH_BLOCK_SIZE - self._block_len)
+            self._block.update(view[:take])
+            self._block_len += take
+            view = view[take:]
+            if self._block_len == HASH_BLOCK_SIZE:
+                self._digests.append(self._block.digest())
+                self._block = hashlib.sha256()
+                self._block_len = 0
+
+    def hexdigest(self) -> str:
+        digests = self._digests
+        if self._block_len:
+            digests = digests + [self._block.digest()]
+        return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+def _chunk_hash(data: bytes) -> str:
+    """Return the Dropbox content hash of a single request body."""
+    hasher = _ContentHasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def _is_not_found(error: dropbox.exceptions.ApiError) -> bool:
+    """
+    Check whether an API error means the requested path does not exist.
+
+    Args:
+        error (dropbox.exceptions.ApiError): Error raised by a lookup call
+
+    Returns:
+        bool: True for path/not_found lookup errors
+    """
+    err = error.error
+    return hasattr(err, "is_path") and err.is_path() and err.get_path().is_not_found()
+
+
+def _scan_files(root: str) -> Iterator[Tuple[str, int]]:
+    """
+    Recursively yield (path, size) for every regular file under root.
+
+    Args:
+        root (str): Directory to walk
+
+    Yields:
+        Tuple[str, int]: File path and size in bytes
+
+    Note:
+        Uses os.scandir so type checks and sizes come from the directory
+        entries instead of separate stat calls per file. Symlinked files
+        are included with the size of their target; symlinked
+        directories are not traversed.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path)
+            elif entry.is_file():
+                yield entry.path, entry.stat().st_size
+
 
 class FileOperations(BaseOperations):
     """
@@ -28,8 +116,16 @@ class FileOperations(BaseOperations):
 
     Inherits from:
         BaseOperations: Core Dropbox operations functionality
+
+    Attributes:
+        LARGE_FILE_THRESHOLD (int): Files above this size (150MB) are
+            transferred in sessions instead of a single request
+        UPLOAD_BATCH_SIZE (int): Maximum files committed per batch upload call
     """
 
+    LARGE_FILE_THRESHOLD = Config.LARGE_FILE_THRESHOLD
+    UPLOAD_BATCH_SIZE = 1000
+
     def _read_file_chunks(self, local_path: str, file_size: int) -> bytes:
         """
         Read file in chunks for efficient memory usage.
@@ -79,21 +175,21 @@ class FileOperations(BaseOperations):
             FileMetadata: Metadata of uploaded file
 
         Note:
-            Calculates SHA256 hash for content verification
+            Sends the Dropbox content hash for content verification
         """
-        hasher = hashlib.sha256()
-        hasher.update(content)
-        content_hash = hasher.hexdigest()
-
         return self.dbx.files_upload(
             content,
             dropbox_path,
             mode=mode,
-            content_hash=content_hash,
+            content_hash=_chunk_hash(content),
         )
 
     def _upload_large_file(
-        self, local_path: str, dropbox_path: str, mode: WriteMode
+        self,
+        local_path: str,
+        dropbox_path: str,
+        mode: WriteMode,
+        file_size: Optional[int] = None,
     ) -> FileMetadata:
         """
         Upload a large file (>150MB) to Dropbox using upload sessions.
@@ -102,6 +198,7 @@ class FileOperations(BaseOperations):
             local_path (str): Source file path
             dropbox_path (str): Destination path in Dropbox
             mode (WriteMode): Upload mode (add/overwrite)
+            file_size (Optional[int]): Size of the file if already known
 
         Returns:
             FileMetadata: Metadata of uploaded file
@@ -110,8 +207,11 @@ class FileOperations(BaseOperations):
             - Uses upload sessions for files >150MB
             - Shows progress with tqdm
             - Handles chunked uploads automatically
+            - Each request carries the content hash of its own chunk so
+              Dropbox can verify every piece as it arrives
         """
-        file_size = Path(local_path).stat().st_size
+        if file_size is None:
+            file_size = Path(local_path).stat().st_size
         with open(local_path, "rb") as f:
             with tqdm(
                 total=file_size,
@@ -120,31 +220,35 @@ class FileOperations(BaseOperations):
                 unit_scale=True,
             ) as pbar:
                 # Start upload session
+                chunk = f.read(self.CHUNK_SIZE)
                 session_start = self.dbx.files_upload_session_start(
-                    f.read(self.CHUNK_SIZE)
+                    chunk, content_hash=_chunk_hash(chunk)
                 )
-                pbar.update(self.CHUNK_SIZE)
+                pbar.update(len(chunk))
                 cursor = dropbox.files.UploadSessionCursor(
                     session_id=session_start.session_id, offset=f.tell()
                 )
                 commit = dropbox.files.CommitInfo(path=dropbox_path, mode=mode)
-                while f.tell() < file_size:
-                    if (file_size - f.tell()) <= self.CHUNK_SIZE:
-                        return self.dbx.files_upload_session_finish(
-                            f.read(self.CHUNK_SIZE), cursor, commit
-                        )
-                    else:
-                        self.dbx.files_upload_session_append_v2(
-                            f.read(self.CHUNK_SIZE), cursor
-                        )
-                        cursor.offset = f.tell()
-                        pbar.update(self.CHUNK_SIZE)
+                while (file_size - f.tell()) > self.CHUNK_SIZE:
+                    chunk = f.read(self.CHUNK_SIZE)
+                    self.dbx.files_upload_session_append_v2(
+                        chunk, cursor, content_hash=_chunk_hash(chunk)
+                    )
+                    cursor.offset = f.tell()
+                    pbar.update(len(chunk))
+
+                chunk = f.read(self.CHUNK_SIZE)
+                pbar.update(len(chunk))
                 return self.dbx.files_upload_session_finish(
-                    f.read(self.CHUNK_SIZE), cursor, commit
+                    chunk, cursor, commit, content_hash=_chunk_hash(chunk)
                 )
 
     def _upload_file(
-        self, local_path: str, dropbox_path: str, mode: WriteMode
+        self,
+        local_path: str,
+        dropbox_path: str,
+        mode: WriteMode,
+        file_size: Optional[int] = None,
     ) -> FileMetadata:
         """
         Upload a file to Dropbox, choosing the appropriate method based on size.
@@ -153,6 +257,8 @@ class FileOperations(BaseOperations):
             local_path (str): Source file path
             dropbox_path (str): Destination path in Dropbox
             mode (WriteMode): Upload mode (add/overwrite)
+            file_size (Optional[int]): Size of the file if already known;
+                the file is stat'd otherwise
 
         Returns:
             FileMetadata: Metadata of uploaded file
@@ -160,12 +266,161 @@ class FileOperations(BaseOperations):
         Note:
             Automatically selects between small and large file upload methods
         """
-        file_size = Path(local_path).stat().st_size
-        if file_size <= 150 * 1024 * 1024:  # 150MB
+        if file_size is None:
+            file_size = Path(local_path).stat().st_size
+        if file_size <= self.LARGE_FILE_THRESHOLD:
             content = self._read_file_chunks(local_path, file_size)
             return self._upload_small_file(content, dropbox_path, mode, local_path)
         else:
-            return self._upload_large_file(local_path, dropbox_path, mode)
+            return self._upload_large_file(local_path, dropbox_path, mode, file_size)
+
+    def _start_batch_entry(
+        self, local_path: str, dropbox_path: str, file_size: int, mode: WriteMode
+    ) -> dropbox.files.UploadSessionFinishArg:
+        """
+        Upload a small file's content in a closed upload session.
+
+        Args:
+            local_path (str): Source file path
+            dropbox_path (str): Destination path in Dropbox
+            file_size (int): Size of the file in bytes
+            mode (WriteMode): Upload mode (add/overwrite)
+
+        Returns:
+            UploadSessionFinishArg: Batch entry committing the session to dropbox_path
+        """
+        content = self._read_file_chunks(local_path, file_size)
+        session = self.dbx.files_upload_session_start(
+            content, close=True, content_hash=_chunk_hash(content)
+        )
+        return dropbox.files.UploadSessionFinishArg(
+            cursor=dropbox.files.UploadSessionCursor(
+                session_id=session.session_id, offset=len(content)
+            ),
+            commit=dropbox.files.CommitInfo(path=dropbox_path, mode=mode),
+        )
+
+    def _content_hash(self, local_path: str) -> str:
+        """
+        Compute the Dropbox content hash of a local file.
+
+        Args:
+            local_path (str): File to hash
+
+        Returns:
+            str: Hex digest comparable to FileMetadata.content_hash
+        """
+        hasher = _ContentHasher()
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _is_unchanged(
+        self, local_path: str, file_size: int, remote_size: int, remote_hash: str
+    ) -> bool:
+        """
+        Check whether a local file matches a file already in Dropbox.
+
+        Args:
+            local_path (str): Local file path
+            file_size (int): Size of the local file in bytes
+            remote_size (int): Size of the Dropbox file in bytes
+            remote_hash (str): Content hash of the Dropbox file
+
+        Returns:
+            bool: True if sizes and content hashes match
+
+        Note:
+            The local file is only read when the sizes match
+        """
+        return (
+            file_size == remote_size and self._content_hash(local_path) == remote_hash
+        )
+
+    def _remote_files(self, folders: Iterable[str]) -> Dict[str, FileMetadata]:
+        """
+        Index the files directly inside Dropbox folders by lowercase path.
+
+        Args:
+            folders (Iterable[str]): Dropbox folders to list (not recursively)
+
+        Returns:
+            Dict[str, FileMetadata]: File metadata keyed by path; folders
+                that do not exist contribute nothing
+
+        Note:
+            Calls files_list_folder directly rather than list_files so a
+            missing folder, the usual case for a new upload, is not logged
+            as an error
+        """
+        remote: Dict[str, FileMetadata] = {}
+        for folder in folders:
+            try:
+                result = self.dbx.files_list_folder(
+                    "" if folder == "/" else folder, limit=self.LIST_FOLDER_LIMIT
+                )
+            except dropbox.exceptions.ApiError as e:
+                if _is_not_found(e):
+                    continue
+                raise
+            while True:
+                for entry in result.entries:
+                    if isinstance(entry, FileMetadata):
+                        remote[entry.path_lower] = entry
+                if not result.has_more:
+                    break
+                result = self.dbx.files_list_folder_continue(result.cursor)
+        return remote
+
+    def _upload_batch(
+        self, uploads: List[Tuple[str, str, int]], mode: WriteMode
+    ) -> List[FileMetadata]:
+        """
+        Upload small files (≤ 150MB) with batched upload session commits.
+
+        Args:
+            uploads (List[Tuple[str, str, int]]): (local path, Dropbox path,
+                size) triples
+            mode (WriteMode): Upload mode (add/overwrite)
+
+        Returns:
+            List[FileMetadata]: Metadata of uploaded files, in input order
+
+        Raises:
+            UploadError: If Dropbox rejects any file in a batch or returns
+                a result count that does not match the batch
+
+        Note:
+            - File contents are sent concurrently, one closed session per file
+            - Sessions are committed with one finish_batch call per
+              UPLOAD_BATCH_SIZE files
+        """
+        uploaded: List[FileMetadata] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, len(uploads), self.UPLOAD_BATCH_SIZE):
+                batch = uploads[start : start + self.UPLOAD_BATCH_SIZE]
+                entries = list(
+                    executor.map(
+                        lambda item: self._start_batch_entry(
+                            item[0], item[1], item[2], mode
+                        ),
+                        batch,
+                    )
+                )
+                result = self.dbx.files_upload_session_finish_batch_v2(entries)
+                if len(result.entries) != len(batch):
+                    raise UploadError(
+                        f"Batch upload returned {len(result.entries)} results "
+                        f"for {len(batch)} files"
+                    )
+                for (local_path, _, _), entry in zip(batch, result.entries):
+                    if entry.is_failure():
+                        raise UploadError(
+                            f"Error uploading {local_path}: {entry.get_failure()}"
+                        )
+                    uploaded.append(entry.get_success())
+        return uploaded
 
     def upload(
         self, local_path: str, dropbox_path: str, overwrite: bool = False
@@ -184,6 +439,16 @@ class FileOperations(BaseOperations):
         Raises:
             Exception: If upload fails
 
+        Note:
+            - Files already in Dropbox with the same size and content hash
+              are not uploaded again; their existing metadata is returned.
+              The check always asks Dropbox, never the metadata cache, and
+              only lists the folders the upload writes to
+            - Directory contents are uploaded concurrently using up to
+              max_workers threads; results are ordered by local path
+            - Small files in a directory are committed in batches
+              (see _upload_batch); large files use upload sessions
+
         Example:
             ```python
             # Upload single file
@@ -199,20 +464,72 @@ class FileOperations(BaseOperations):
             results: List[dict] = []
 
             if path.is_file():
-                result = self._upload_file(str(path), dropbox_path, mode)
+                file_size = path.stat().st_size
+                try:
+                    # Never trust the metadata cache here: a stale entry
+                    # would silently drop the upload
+                    existing = self.dbx.files_get_metadata(dropbox_path)
+                except dropbox.exceptions.ApiError as e:
+                    if not _is_not_found(e):
+                        raise
+                    existing = None
+                if isinstance(existing, FileMetadata) and self._is_unchanged(
+                    str(path), file_size, existing.size, existing.content_hash
+                ):
+                    result = existing
+                else:
+                    result = self._upload_file(str(path), dropbox_path, mode, file_size)
                 results.append(self._process_metadata(result))
             else:
-                for file_path in path.rglob("*"):
-                    if file_path.is_file():
-                        rel_path = file_path.relative_to(path)
-                        dbx_path = str(Path(dropbox_path) / rel_path)
-                        result = self._upload_file(str(file_path), dbx_path, mode)
-                        results.append(self._process_metadata(result))
+                uploaded: Dict[Tuple[str, str, int], dict] = {}
+                uploads = [
+                    (
+                        file_path,
+                        posixpath.join(
+                            dropbox_path,
+                            Path(file_path).relative_to(path).as_posix(),
+                        ),
+                        size,
+                    )
+                    for file_path, size in sorted(_scan_files(str(path)))
+                ]
+                remote = self._remote_files(
+                    sorted({posixpath.dirname(item[1]) for item in uploads})
+                )
+                small: List[Tuple[str, str, int]] = []
+                large: List[Tuple[str, str, int]] = []
+                for item in uploads:
+                    existing = remote.get(item[1].lower())
+                    if existing and self._is_unchanged(
+                        item[0], item[2], existing.size, existing.content_hash
+                    ):
+                        uploaded[item] = self._process_metadata(existing)
+                    elif item[2] <= self.LARGE_FILE_THRESHOLD:
+                        small.append(item)
+                    else:
+                        large.append(item)
+
+                for item, metadata in zip(small, self._upload_batch(small, mode)):
+                    uploaded[item] = self._process_metadata(metadata)
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for item, metadata in zip(
+                        large,
+                        executor.map(
+                            lambda item: self._upload_file(
+                                item[0], item[1], mode, item[2]
+                            ),
+                            large,
+                        ),
+                    ):
+                        uploaded[item] = self._process_metadata(metadata)
+                results.extend(uploaded[item] for item in uploads)
 
             return pd.DataFrame(results)
         except Exception as e:
             logger.error(f"Error uploading: {e}")
             raise
+        finally:
+            self._invalidate_metadata(dropbox_path)
 
     def _download_file(self, dropbox_path: str, local_path: str) -> FileMetadata:
         """
@@ -229,26 +546,33 @@ class FileOperations(BaseOperations):
             - Creates parent directories if needed
             - Shows download progress
             - Automatically handles large files
+            - Streams the response body to disk in CHUNK_SIZE blocks
         """
         try:
             Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-            metadata = self.dbx.files_get_metadata(dropbox_path)
+            metadata = self._get_metadata_cached(dropbox_path)
 
-            if isinstance(metadata, FileMetadata) and metadata.size > 150 * 1024 * 1024:
+            if (
+                isinstance(metadata, FileMetadata)
+                and metadata.size > self.LARGE_FILE_THRESHOLD
+            ):
                 return self._download_large_file(dropbox_path, local_path)
 
             with open(local_path, "wb") as f:
                 metadata, response = self.dbx.files_download(dropbox_path)
-                with tqdm(
-                    total=metadata.size,
-                    desc=f"Downloading {Path(local_path).name}",
-                    unit="B",
-                    unit_scale=True,
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
+                with (
+                    closing(response),
+                    tqdm.wrapattr(
+                        f,
+                        "write",
+                        total=metadata.size,
+                        desc=f"Downloading {Path(local_path).name}",
+                    ) as out,
+                ):
+                    # Stream the raw body straight to disk, decoding any
+                    # transfer encoding as requests' iter_content would
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, out, self.CHUNK_SIZE)
             return metadata
 
         except Exception as e:
@@ -272,7 +596,7 @@ class FileOperations(BaseOperations):
             - Handles chunked downloads automatically
         """
         try:
-            metadata = self.dbx.files_get_metadata(dropbox_path)
+            metadata = self._get_metadata_cached(dropbox_path)
 
             with open(local_path, "wb") as f:
                 with tqdm(
@@ -333,7 +657,7 @@ class FileOperations(BaseOperations):
             - Shows progress for each file
         """
         try:
-            metadata = self.dbx.files_get_metadata(dropbox_path)
+            metadata = self._get_metadata_cached(dropbox_path)
             results = []
 
             if isinstance(metadata, FileMetadata):
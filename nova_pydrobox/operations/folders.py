@@ -52,6 +52,7 @@ class FolderOperations(BaseOperations):
         """
         try:
             response = self.dbx.files_create_folder_v2(path)
+            self._invalidate_metadata(path)
             result = self._process_metadata(response.metadata)
             return pd.DataFrame([result])
         except dropbox.exceptions.ApiError as e:
@@ -61,7 +62,7 @@ class FolderOperations(BaseOperations):
                 and e.error.get_path().is_conflict()
             ):
                 # Handle folder already exists case
-                metadata = self.dbx.files_get_metadata(path)
+                metadata = self._get_metadata_cached(path)
                 result = self._process_metadata(metadata)
                 return pd.DataFrame([result])
             logger.error(f"Error creating folder at {path}: {e}")
@@ -108,7 +109,7 @@ class FolderOperations(BaseOperations):
         Returns:
             pd.DataFrame: DataFrame containing the folder structure with columns:
                 - name: File/folder name
-                - path: Full Dropbox path
+                - path: Full Dropbox path (lowercase)
                 - type: 'file' or 'folder'
                 - size: Size in bytes
                 - modified: Last modification time
@@ -167,17 +168,19 @@ class FolderOperations(BaseOperations):
             logger.error(f"Error checking if folder {path} is empty: {e}")
             raise
 
-    def get_folder_metadata(self, path: str) -> pd.DataFrame:
+    def get_folder_metadata(self, path: str, use_cache: bool = True) -> pd.DataFrame:
         """
         Get metadata for a specific folder.
 
         Args:
             path (str): The Dropbox path of the folder
+            use_cache (bool, optional): Whether a recent cached lookup may be
+                returned. Defaults to True.
 
         Returns:
             pd.DataFrame: DataFrame containing the folder's metadata with columns:
                 - name: Folder name
-                - path: Full Dropbox path
+                - path: Full Dropbox path (lowercase)
                 - type: Always 'folder'
                 - size: 0 (folders have no size)
                 - modified: Last modification time
@@ -189,6 +192,9 @@ class FolderOperations(BaseOperations):
         Note:
             - Validates that path points to a folder
             - Returns standardized metadata format
+            - With use_cache, changes made by other clients may not show for
+              up to METADATA_CACHE_TTL seconds; pass use_cache=False to
+              always ask Dropbox
 
         Example:
             ```python
@@ -198,7 +204,11 @@ class FolderOperations(BaseOperations):
             ```
         """
         try:
-            metadata = self.dbx.files_get_metadata(path)
+            metadata = (
+                self._get_metadata_cached(path)
+                if use_cache
+                else self.dbx.files_get_metadata(path)
+            )
             if not isinstance(metadata, FolderMetadata):
                 raise ValueError(f"{path} is not a folder")
             result = self._process_metadata(metadata)
@@ -1,9 +1,13 @@
 """Progress bar utilities for nova-pydrobox."""
 
+from functools import lru_cache
 from typing import Union
 
 from tqdm import tqdm
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SECONDS_PER_HOUR = 3600
+
 
 def create_progress_bar(
     total: int,
@@ -49,20 +53,24 @@ def create_progress_bar(
     return bar
 
 
+@lru_cache(maxsize=1024)
 def format_size(size_bytes: int) -> str:
     """Format file size in bytes to human readable format.
 
+    Results are memoized, since progress updates format the same chunk
+    and file sizes repeatedly.
+
     Args:
         size_bytes: Size in bytes.
 
     Returns:
         Formatted string representing the size.
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit spans 10 bits, so the bit length picks it without a loop
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << 10 * index):.2f} {_SIZE_UNITS[index]}"
 
 
 def estimate_time(
@@ -78,16 +86,15 @@ def estimate_time(
     Returns:
         Formatted string with the estimated time remaining.
     """
-    if speed_bytes_per_sec == 0:
+    if speed_bytes_per_sec <= 0:
         return "unknown"
 
     remaining_bytes = total_bytes - completed_bytes
-    seconds = remaining_bytes / speed_bytes_per_sec
+    if remaining_bytes <= 0:
+        return "0s"
 
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    elif seconds < 3600:
-        return f"{int(seconds)}s"  # Keep in seconds to match test expectations
-    else:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
+    # Anything under an hour stays in whole seconds
+    seconds = remaining_bytes / speed_bytes_per_sec
+    if seconds >= _SECONDS_PER_HOUR:
+        return f"{seconds / _SECONDS_PER_HOUR:.1f}h"
+    return f"{int(seconds)}s"
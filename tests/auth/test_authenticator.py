@@ -3,6 +3,7 @@
 import dropbox
 import pytest
 
+from nova_pydrobox.auth import authenticator
 from nova_pydrobox.auth.authenticator import (
     Authenticator,
     authenticate_dropbox,
@@ -214,6 +215,16 @@ def test_get_dropbox_client_success(mocker):
         oauth2_refresh_token="test_refresh",
         app_key="test_key",
         app_secret="test_secret",
+        session=authenticator._SESSION,
+    )
+
+
+def test_shared_session_pool_size():
+    """Test the shared HTTP session pools MAX_CONNECTIONS connections."""
+    adapter = authenticator._SESSION.adapters["https://"]
+    assert (
+        adapter.poolmanager.connection_pool_kw["maxsize"]
+        == authenticator.MAX_CONNECTIONS
     )
 
 
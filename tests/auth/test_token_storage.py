@@ -115,6 +115,20 @@ def test_save_tokens_file_success(test_tokens, mock_config_dir, mock_fernet, moc
     mock_path.chmod.assert_called_once_with(0o600)
 
 
+def test_fernet_instance_reused(test_tokens, mocker):
+    """Test the encryption key is loaded once per storage instance."""
+    storage = TokenStorage(force_fernet=True)
+    mock_path = mocker.Mock()
+    mocker.patch.object(storage, "_get_token_path", return_value=mock_path)
+    mock_key = mocker.patch.object(
+        storage, "_get_or_create_encryption_key", return_value=Fernet.generate_key()
+    )
+
+    assert storage.save_tokens(dict(test_tokens)) is True
+    assert storage.save_tokens(dict(test_tokens)) is True
+    mock_key.assert_called_once()
+
+
 def test_get_tokens_keyring_success(test_tokens, mocker):
     """Test retrieving tokens using keyring backend."""
     storage = TokenStorage()
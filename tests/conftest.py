@@ -29,9 +29,10 @@ def mock_token_storage(mocker):
     return storage
 
 
-@pytest.fixture
-def temp_test_files(tmp_path):
-    # Create test files/folders structure
-    test_file = tmp_path / "test.txt"
+@pytest.fixture(scope="session")
+def temp_test_files(tmp_path_factory):
+    # Create test files/folders structure once per session; treat as read-only
+    test_dir = tmp_path_factory.mktemp("test_files")
+    test_file = test_dir / "test.txt"
     test_file.write_text("test content")
-    return tmp_path
+    return test_dir
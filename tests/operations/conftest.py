@@ -0,0 +1,29 @@
+"""Shared fixtures for the operations tests."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+# Shared fixture values for fake Dropbox metadata
+FIXED_TS = datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)
+FAKE_HASH = "a" * 64  # Valid content hash length
+
+# Module-scoped operations fixtures whose metadata cache is reset per test
+_OPS_FIXTURES = ("base_ops", "file_ops", "folder_ops")
+
+
+@pytest.fixture(scope="module")
+def mock_dropbox_client():
+    """Shared mocked Dropbox client; modules may override it."""
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_dropbox_client(request, mock_dropbox_client):
+    """Reset the shared mocked client and metadata cache after each test."""
+    yield
+    mock_dropbox_client.reset_mock(return_value=True, side_effect=True)
+    for name in _OPS_FIXTURES:
+        if name in request.fixturenames:
+            request.getfixturevalue(name)._invalidate_metadata("/")
@@ -1,6 +1,7 @@
 """Tests for the base operations module."""
 
-from datetime import datetime, timezone
+import hashlib
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import dropbox
@@ -8,18 +9,21 @@ import pandas as pd
 import pytest
 from dropbox.files import FileMetadata, FolderMetadata, ListFolderResult
 
-from nova_pydrobox.operations.base import BaseOperations, FileFilter
+from nova_pydrobox.operations.base import BaseOperations, FileFilter, FileType
+from tests.operations.conftest import FAKE_HASH, FIXED_TS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dropbox_client():
-    with patch("nova_pydrobox.auth.authenticator.get_dropbox_client") as mock:
-        client = MagicMock()
-        mock.return_value = client
+    client = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "nova_pydrobox.operations.base.get_dropbox_client", lambda: client
+        )
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_ops(mock_dropbox_client):
     """Create BaseOperations instance with mocked client."""
     return BaseOperations(dbx_client=mock_dropbox_client)
@@ -27,13 +31,9 @@ def base_ops(mock_dropbox_client):
 
 def test_init_success(mock_dropbox_client):
     """Test successful initialization of BaseOperations."""
-    with patch(
-        "nova_pydrobox.operations.base.get_dropbox_client",
-        return_value=mock_dropbox_client,
-    ):
-        ops = BaseOperations()
-        assert ops.dbx == mock_dropbox_client
-        assert ops.max_workers == 4
+    ops = BaseOperations()
+    assert ops.dbx is mock_dropbox_client
+    assert ops.max_workers == 4
 
 
 def test_init_failure():
@@ -52,6 +52,57 @@ def test_calculate_file_hash(base_ops, tmp_path):
     hash_result = base_ops._calculate_file_hash(str(test_file))
     assert isinstance(hash_result, str)
     assert len(hash_result) == 64  # SHA256 hash length
+    assert hash_result == hashlib.sha256(test_content).hexdigest()
+
+
+def test_calculate_file_hash_without_file_digest(base_ops, tmp_path, monkeypatch):
+    """Test file hash calculation on Pythons without hashlib.file_digest."""
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    test_file = tmp_path / "test.txt"
+    test_content = b"test content"
+    test_file.write_bytes(test_content)
+
+    hash_result = base_ops._calculate_file_hash(str(test_file))
+    assert hash_result == hashlib.sha256(test_content).hexdigest()
+
+
+def test_get_metadata_cached(base_ops, mock_dropbox_client):
+    """Test repeated metadata lookups within the TTL hit the API once."""
+    metadata = FolderMetadata(name="test_folder", path_lower="/test_folder")
+    mock_dropbox_client.files_get_metadata.return_value = metadata
+
+    assert base_ops._get_metadata_cached("/test_folder") is metadata
+    assert base_ops._get_metadata_cached("/Test_Folder/") is metadata
+    mock_dropbox_client.files_get_metadata.assert_called_once_with("/test_folder")
+
+
+def test_get_metadata_cached_expired(base_ops, mock_dropbox_client):
+    """Test expired cache entries are fetched again."""
+    base_ops._get_metadata_cached("/test.txt", ttl=0)
+    base_ops._get_metadata_cached("/test.txt", ttl=0)
+    assert mock_dropbox_client.files_get_metadata.call_count == 2
+
+
+def test_get_metadata_cached_evicts_lru(base_ops, mock_dropbox_client, monkeypatch):
+    """Test the cache is bounded and evicts the least recently used entry."""
+    monkeypatch.setattr(base_ops, "METADATA_CACHE_SIZE", 2)
+    base_ops._get_metadata_cached("/a")
+    base_ops._get_metadata_cached("/b")
+    base_ops._get_metadata_cached("/a")  # hit, /b is now least recent
+    base_ops._get_metadata_cached("/c")
+
+    assert list(base_ops._meta_cache) == ["/a", "/c"]
+    assert mock_dropbox_client.files_get_metadata.call_count == 3
+
+
+def test_delete_invalidates_metadata_cache(base_ops, mock_dropbox_client):
+    """Test deleting a folder drops cached metadata for it and its contents."""
+    base_ops._get_metadata_cached("/folder")
+    base_ops._get_metadata_cached("/folder/test.txt")
+    base_ops._get_metadata_cached("/folder2")
+
+    base_ops.delete("/folder")
+    assert set(base_ops._meta_cache) == {"/folder2"}
 
 
 def test_process_metadata_file(base_ops):
@@ -59,9 +110,9 @@ def test_process_metadata_file(base_ops):
     metadata = FileMetadata(
         name="test.txt",
         path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,  # Valid 64-character hex string
+        content_hash=FAKE_HASH,
     )
 
     result = base_ops._process_metadata(metadata)
@@ -71,7 +122,7 @@ def test_process_metadata_file(base_ops):
         "type": "file",
         "size": 100,
         "modified": "2023-01-01T00:00:00Z",
-        "hash": "a" * 64,
+        "hash": FAKE_HASH,
     }
 
 
@@ -96,9 +147,9 @@ def test_process_listing_result(base_ops):
         FileMetadata(
             name="test.txt",
             path_lower="/test.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=100,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         ),
         FolderMetadata(name="test_folder", path_lower="/test_folder"),
     ]
@@ -109,6 +160,38 @@ def test_process_listing_result(base_ops):
     assert len(df) == 2
     assert df.iloc[0]["type"] == "file"
     assert df.iloc[1]["type"] == "folder"
+    assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+    assert df["size"].dtype == "int64"
+
+
+def test_process_listing_result_empty(base_ops):
+    """Test processing of an empty listing keeps the metadata columns."""
+    result = ListFolderResult(entries=[], cursor="cursor123", has_more=False)
+
+    df = base_ops._process_listing_result(result)
+    assert df.empty
+    assert list(df.columns) == ["name", "path", "type", "size", "modified", "hash"]
+
+
+def test_process_metadata_batch(base_ops):
+    """Test batch processing matches per-entry processing."""
+    entries = [
+        FileMetadata(
+            name="test.txt",
+            path_lower="/test.txt",
+            client_modified=FIXED_TS,
+            size=100,
+            content_hash=FAKE_HASH,
+        ),
+        FolderMetadata(name="folder", path_lower="/folder", id="id123"),
+    ]
+
+    df = base_ops._process_metadata_batch(entries)
+    assert list(df.columns) == ["name", "path", "type", "size", "modified", "hash"]
+    assert list(df["name"]) == ["test.txt", "folder"]
+    assert list(df["type"]) == ["file", "folder"]
+    assert list(df["size"]) == [100, 0]
+    assert df.iloc[0]["hash"] == FAKE_HASH
 
 
 def test_list_files_basic(base_ops, mock_dropbox_client):
@@ -117,9 +200,9 @@ def test_list_files_basic(base_ops, mock_dropbox_client):
         FileMetadata(
             name="test.txt",
             path_lower="/test.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=100,
-            content_hash="a" * 64,  # 64-char hash required
+            content_hash=FAKE_HASH,
         )
     ]
     mock_result = ListFolderResult(entries=entries, cursor="cursor123", has_more=False)
@@ -128,7 +211,9 @@ def test_list_files_basic(base_ops, mock_dropbox_client):
     result = base_ops.list_files()
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 1
-    mock_dropbox_client.files_list_folder.assert_called_once_with("", recursive=False)
+    mock_dropbox_client.files_list_folder.assert_called_once_with(
+        "", recursive=False, limit=2000
+    )
 
 
 def test_list_files_with_filter(base_ops, mock_dropbox_client):
@@ -137,16 +222,16 @@ def test_list_files_with_filter(base_ops, mock_dropbox_client):
         FileMetadata(
             name="test.txt",
             path_lower="/test.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=100,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         ),
         FileMetadata(
             name="big.txt",
             path_lower="/big.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=1000,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         ),
     ]
     mock_result = ListFolderResult(entries=entries, cursor="cursor123", has_more=False)
@@ -158,24 +243,46 @@ def test_list_files_with_filter(base_ops, mock_dropbox_client):
     assert len(result) == 1
 
 
+def test_file_filter_apply():
+    """Test FileFilter combines its criteria into one filter."""
+    df = pd.DataFrame(
+        {
+            "name": ["small.txt", "medium.txt", "large.txt", "folder"],
+            "type": ["file", "file", "file", "folder"],
+            "size": [10, 500, 5000, 0],
+        }
+    )
+
+    result = FileFilter(file_type=FileType.FOLDER).apply(df)
+    assert list(result["name"]) == ["folder"]
+
+    result = FileFilter(min_size=100, max_size=1000).apply(df)
+    assert list(result["name"]) == ["medium.txt"]
+
+    assert FileFilter(file_type=FileType.FOLDER, min_size=1).apply(df).empty
+
+    assert FileFilter().apply(df) is df
+    assert FileFilter(min_size=100).apply(pd.DataFrame()).empty
+
+
 def test_list_files_pagination(base_ops, mock_dropbox_client):
     """Test file listing with pagination."""
     entries1 = [
         FileMetadata(
             name="test1.txt",
             path_lower="/test1.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=100,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         )
     ]
     entries2 = [
         FileMetadata(
             name="test2.txt",
             path_lower="/test2.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=200,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         )
     ]
 
@@ -190,6 +297,26 @@ def test_list_files_pagination(base_ops, mock_dropbox_client):
     assert len(result) == 2
     assert result.iloc[0]["name"] == "test1.txt"
     assert result.iloc[1]["name"] == "test2.txt"
+    assert mock_dropbox_client.files_list_folder.call_args.kwargs["limit"] == 2000
+    mock_dropbox_client.files_list_folder_continue.assert_called_once_with("cursor123")
+
+
+def test_list_files_pagination_error(base_ops, mock_dropbox_client):
+    """Test an API error on a prefetched page is raised."""
+    mock_dropbox_client.files_list_folder.return_value = ListFolderResult(
+        entries=[], cursor="cursor123", has_more=True
+    )
+    mock_dropbox_client.files_list_folder_continue.side_effect = (
+        dropbox.exceptions.ApiError(
+            request_id="test_id",
+            error="test_error",
+            user_message_text="Test error",
+            user_message_locale="en",
+        )
+    )
+
+    with pytest.raises(dropbox.exceptions.ApiError):
+        base_ops.list_files()
 
 
 def test_list_files_api_error(base_ops, mock_dropbox_client):
@@ -207,7 +334,7 @@ def test_list_files_api_error(base_ops, mock_dropbox_client):
 
 def test_delete(base_ops, mock_dropbox_client):
     """Test delete operation."""
-    mock_dropbox_client.files_delete_v2.return_value = MagicMock()
+    mock_dropbox_client.files_delete_v2.return_value = SimpleNamespace()
 
     result = base_ops.delete("/test.txt")
     assert result is True
@@ -219,11 +346,11 @@ def test_move(base_ops, mock_dropbox_client):
     metadata = FileMetadata(
         name="test.txt",
         path_lower="/new/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
-    mock_dropbox_client.files_move_v2.return_value = MagicMock(metadata=metadata)
+    mock_dropbox_client.files_move_v2.return_value = SimpleNamespace(metadata=metadata)
 
     result = base_ops.move("/test.txt", "/new/test.txt")
     assert isinstance(result, pd.DataFrame)
@@ -236,11 +363,11 @@ def test_copy(base_ops, mock_dropbox_client):
     metadata = FileMetadata(
         name="test.txt",
         path_lower="/new/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
-    mock_dropbox_client.files_copy_v2.return_value = MagicMock(metadata=metadata)
+    mock_dropbox_client.files_copy_v2.return_value = SimpleNamespace(metadata=metadata)
 
     result = base_ops.copy("/test.txt", "/new/test.txt")
     assert isinstance(result, pd.DataFrame)
@@ -253,11 +380,11 @@ def test_rename(base_ops, mock_dropbox_client):
     metadata = FileMetadata(
         name="new.txt",
         path_lower="/new.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
-    mock_dropbox_client.files_move_v2.return_value = MagicMock(metadata=metadata)
+    mock_dropbox_client.files_move_v2.return_value = SimpleNamespace(metadata=metadata)
 
     result = base_ops.rename("/test.txt", "new.txt")
     assert isinstance(result, pd.DataFrame)
@@ -270,12 +397,12 @@ def test_search(base_ops, mock_dropbox_client):
     metadata = FileMetadata(
         name="test.txt",
         path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
-    match = MagicMock(metadata=metadata)
-    mock_result = MagicMock(matches=[match], has_more=False)
+    match = SimpleNamespace(metadata=metadata)
+    mock_result = SimpleNamespace(matches=[match], has_more=False, cursor=None)
     mock_dropbox_client.files_search_v2.return_value = mock_result
 
     result = base_ops.search("test")
@@ -289,23 +416,23 @@ def test_search_with_pagination(base_ops, mock_dropbox_client):
     metadata1 = FileMetadata(
         name="test1.txt",
         path_lower="/test1.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
     metadata2 = FileMetadata(
         name="test2.txt",
         path_lower="/test2.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=200,
         content_hash="b" * 64,
     )
     
-    match1 = MagicMock(metadata=metadata1)
-    match2 = MagicMock(metadata=metadata2)
+    match1 = SimpleNamespace(metadata=metadata1)
+    match2 = SimpleNamespace(metadata=metadata2)
     
-    result1 = MagicMock(matches=[match1], has_more=True, cursor="cursor123")
-    result2 = MagicMock(matches=[match2], has_more=False)
+    result1 = SimpleNamespace(matches=[match1], has_more=True, cursor="cursor123")
+    result2 = SimpleNamespace(matches=[match2], has_more=False, cursor=None)
     
     mock_dropbox_client.files_search_v2.return_value = result1
     mock_dropbox_client.files_search_continue_v2.return_value = result2
@@ -322,21 +449,21 @@ def test_search_with_filter(base_ops, mock_dropbox_client):
     metadata1 = FileMetadata(
         name="small.txt",
         path_lower="/small.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash="a" * 64,
+        content_hash=FAKE_HASH,
     )
     metadata2 = FileMetadata(
         name="large.txt",
         path_lower="/large.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=1000,
         content_hash="b" * 64,
     )
     
-    match1 = MagicMock(metadata=metadata1)
-    match2 = MagicMock(metadata=metadata2)
-    mock_result = MagicMock(matches=[match1, match2], has_more=False)
+    match1 = SimpleNamespace(metadata=metadata1)
+    match2 = SimpleNamespace(metadata=metadata2)
+    mock_result = SimpleNamespace(matches=[match1, match2], has_more=False, cursor=None)
     mock_dropbox_client.files_search_v2.return_value = mock_result
 
     filter_criteria = FileFilter(min_size=500)
@@ -390,9 +517,9 @@ def test_list_files_root_path(base_ops, mock_dropbox_client):
         FileMetadata(
             name="test.txt",
             path_lower="/test.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+            client_modified=FIXED_TS,
             size=100,
-            content_hash="a" * 64,
+            content_hash=FAKE_HASH,
         )
     ]
     mock_result = ListFolderResult(entries=entries, cursor="cursor123", has_more=False)
@@ -401,7 +528,9 @@ def test_list_files_root_path(base_ops, mock_dropbox_client):
     result = base_ops.list_files("/")
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 1
-    mock_dropbox_client.files_list_folder.assert_called_once_with("", recursive=False)
+    mock_dropbox_client.files_list_folder.assert_called_once_with(
+        "", recursive=False, limit=2000
+    )
 
 
 def test_search_api_error(base_ops, mock_dropbox_client):
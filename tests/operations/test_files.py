@@ -1,66 +1,132 @@
 """Tests for the file operations module."""
 
 import hashlib
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+import io
+from functools import lru_cache
+from unittest.mock import MagicMock, mock_open, patch
 
+import dropbox
 import pandas as pd
 import pytest
-from dropbox.files import FileMetadata, FolderMetadata, WriteMode
-
-from nova_pydrobox.operations.files import FileOperations
-
-
-@pytest.fixture
-def mock_dropbox_client():
-    with patch("nova_pydrobox.auth.authenticator.get_dropbox_client") as mock:
-        client = MagicMock()
-        mock.return_value = client
-        yield client
+from dropbox.files import (
+    FileMetadata,
+    FolderMetadata,
+    GetMetadataError,
+    ListFolderError,
+    ListFolderResult,
+    UploadSessionFinishBatchResult,
+    UploadSessionFinishBatchResultEntry,
+    UploadSessionFinishError,
+    WriteMode,
+)
+
+from nova_pydrobox.exceptions import UploadError
+from nova_pydrobox.operations.files import (
+    HASH_BLOCK_SIZE,
+    FileOperations,
+    _ContentHasher,
+    _scan_files,
+)
+from tests.operations.conftest import FAKE_HASH, FIXED_TS
+
+# Listing of an empty destination folder for directory uploads
+_EMPTY_LISTING = ListFolderResult(entries=[], cursor="cursor", has_more=False)
+
+# Contents of the shared test_file fixture and their Dropbox content hash
+_TEST_CONTENT = b"test content"
+_TEST_HASH = hashlib.sha256(hashlib.sha256(_TEST_CONTENT).digest()).hexdigest()
+
+# One zero-filled chunk, shared by tests that need chunk-sized payloads
+_ZERO_CHUNK = bytes(FileOperations.CHUNK_SIZE)
+
+
+class _ZeroStream(io.RawIOBase):
+    """Read-only stream of size zero bytes served from _ZERO_CHUNK."""
+
+    def __init__(self, size: int):
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, n: int = -1) -> bytes:
+        if n < 0:
+            n = self._size
+        n = min(n, self._size - self._pos, len(_ZERO_CHUNK))
+        self._pos += n
+        return _ZERO_CHUNK[:n]
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class _StreamResp:
+    """Minimal streaming download response: a raw body and close()."""
+
+    def __init__(self, content: bytes = _TEST_CONTENT):
+        self.raw = io.BytesIO(content)
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@lru_cache(maxsize=None)
+def _make_file_metadata(
+    path: str, size: int = 100, content_hash: str = FAKE_HASH
+) -> FileMetadata:
+    """
+    Build FileMetadata for path, named after its last component.
+
+    Instances are cached per argument set and shared between tests, so
+    tests must not modify them.
+    """
+    return FileMetadata(
+        name=path.rsplit("/", 1)[-1],
+        path_lower=path,
+        client_modified=FIXED_TS,
+        size=size,
+        content_hash=content_hash,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def file_ops(mock_dropbox_client):
     """Create FileOperations instance with mocked client."""
     return FileOperations(dbx_client=mock_dropbox_client)
 
 
-@pytest.fixture
-def test_file(tmp_path):
-    file_path = tmp_path / "test.txt"
-    file_path.write_text("test content")
+@pytest.fixture(scope="session")
+def test_file(tmp_path_factory):
+    """Read-only small file shared by all tests."""
+    file_path = tmp_path_factory.mktemp("files") / "test.txt"
+    file_path.write_bytes(_TEST_CONTENT)
     return file_path
 
 
-def test_read_file_chunks(file_ops, test_file):
+def test_read_file_chunks(file_ops):
     """Test reading file in chunks."""
-    content = file_ops._read_file_chunks(str(test_file), test_file.stat().st_size)
-    assert content == b"test content"
+    with patch(
+        "nova_pydrobox.operations.files.open",
+        mock_open(read_data=_TEST_CONTENT),
+        create=True,
+    ) as mocked:
+        content = file_ops._read_file_chunks("/fake/test.txt", len(_TEST_CONTENT))
+    assert content == _TEST_CONTENT
+    mocked.assert_called_once_with("/fake/test.txt", "rb")
 
 
 def test_upload_small_file(file_ops, test_file, mock_dropbox_client):
     """Test uploading a small file."""
-    # Read file content
-    with open(test_file, "rb") as f:
-        test_content = f.read()
-
-    # Calculate hash exactly as the implementation does
-    hasher = hashlib.sha256()
-    hasher.update(test_content)
-    content_hash = hasher.hexdigest()
-
     # Mock the upload response
-    mock_metadata = FileMetadata(
-        name="test.txt",
-        path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=len(test_content),
-        content_hash=content_hash,
+    mock_metadata = _make_file_metadata(
+        "/test.txt", size=len(_TEST_CONTENT), content_hash=_TEST_HASH
     )
 
     # Configure mock to verify input parameters
     def verify_upload(*args, **kwargs):
-        assert kwargs.get("content_hash") == content_hash
+        assert kwargs.get("content_hash") == _TEST_HASH
         assert kwargs.get("mode") == WriteMode.add
         return mock_metadata
 
@@ -68,55 +134,49 @@ def test_upload_small_file(file_ops, test_file, mock_dropbox_client):
 
     # Execute test
     result = file_ops._upload_small_file(
-        test_content, "/test.txt", WriteMode.add, str(test_file)
+        _TEST_CONTENT, "/test.txt", WriteMode.add, str(test_file)
     )
 
     # Verify results
     assert isinstance(result, FileMetadata)
     assert result.name == "test.txt"
-    assert result.content_hash == content_hash
+    assert result.content_hash == _TEST_HASH
     mock_dropbox_client.files_upload.assert_called_once_with(
-        test_content, "/test.txt", mode=WriteMode.add, content_hash=content_hash
-    )
-
-
-def test_upload_large_file(file_ops, test_file, mock_dropbox_client):
-    """Test uploading a large file by mocking the file size to be greater than 150MB."""
-    # Mock file size to be > 150MB
-    with patch("pathlib.Path.stat") as mock_stat:
-        # Create a large file to match the mocked size
-        file_content = b"0" * (200 * 1024 * 1024)  # 200MB
-        with open(test_file, "wb") as f:
-            f.write(file_content)
-        mock_stat.return_value.st_size = 200 * 1024 * 1024  # 200MB
-
-        session_id = "test_session"
-        metadata = FileMetadata(
-            name="test.txt",
-            path_lower="/test.txt",
-            client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-            size=len(file_content),
-            content_hash="a" * 64,
-        )
+        _TEST_CONTENT, "/test.txt", mode=WriteMode.add, content_hash=_TEST_HASH
+    )
 
-        # Mock the session responses
-        mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
-            session_id=session_id
-        )
-        mock_dropbox_client.files_upload_session_finish.return_value = metadata
 
-        # Execute test
-        result = file_ops._upload_large_file(str(test_file), "/test.txt", WriteMode.add)
+def test_upload_large_file(file_ops, mock_dropbox_client):
+    """Test uploading a file larger than 150MB through an upload session."""
+    file_size = 200 * 1024 * 1024  # 200MB, served from memory, nothing on disk
+    metadata = _make_file_metadata("/large.txt", size=file_size)
 
-        # Verify results
-        assert isinstance(result, FileMetadata)
-        assert result.name == "test.txt"
+    # Mock the session responses
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish.return_value = metadata
+
+    # Execute test
+    with patch(
+        "nova_pydrobox.operations.files.open",
+        return_value=_ZeroStream(file_size),
+        create=True,
+    ) as mock_open:
+        result = file_ops._upload_large_file(
+            "large.txt", "/large.txt", WriteMode.add, file_size
+        )
+    mock_open.assert_called_once_with("large.txt", "rb")
+
+    # Verify results
+    assert isinstance(result, FileMetadata)
+    assert result.name == "large.txt"
 
-        # Verify the session start was called with the first chunk
-        mock_dropbox_client.files_upload_session_start.assert_called_once()
-        actual_chunk = mock_dropbox_client.files_upload_session_start.call_args[0][0]
-        assert isinstance(actual_chunk, bytes)
-        assert len(actual_chunk) == file_ops.CHUNK_SIZE
+    # Verify the session start was called with the first chunk
+    mock_dropbox_client.files_upload_session_start.assert_called_once()
+    actual_chunk = mock_dropbox_client.files_upload_session_start.call_args[0][0]
+    assert isinstance(actual_chunk, bytes)
+    assert actual_chunk == _ZERO_CHUNK
 
 
 def test_upload_file_small(file_ops, test_file):
@@ -130,25 +190,22 @@ def test_upload_file_small(file_ops, test_file):
         )
 
 
-def test_upload_file_large(file_ops, tmp_path):
-    """Test upload_file with a large file."""
+def test_upload_file_large(file_ops, tmp_path, monkeypatch):
+    """Test upload_file with a file over the large-file threshold."""
+    monkeypatch.setattr(file_ops, "LARGE_FILE_THRESHOLD", 8)
     large_file = tmp_path / "large.txt"
-    large_file.write_bytes(b"0" * (150 * 1024 * 1024 + 1))  # Slightly over 150MB
+    large_file.write_bytes(b"012345678")  # One byte over the threshold
 
     with patch.object(file_ops, "_upload_large_file") as mock_upload:
         file_ops._upload_file(str(large_file), "/large.txt", WriteMode.add)
-        mock_upload.assert_called_once()
+        mock_upload.assert_called_once_with(
+            str(large_file), "/large.txt", WriteMode.add, 9
+        )
 
 
 def test_upload_single_file(file_ops, test_file):
     """Test upload of a single file."""
-    metadata = FileMetadata(
-        name="test.txt",
-        path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,  # Use valid hash length
-    )
+    metadata = _make_file_metadata("/test.txt")
 
     with patch.object(file_ops, "_upload_file", return_value=metadata):
         result = file_ops.upload(str(test_file), "/test.txt")
@@ -157,88 +214,370 @@ def test_upload_single_file(file_ops, test_file):
         assert result.iloc[0]["name"] == "test.txt"
 
 
-def test_upload_directory(file_ops, tmp_path):
+def test_upload_directory(file_ops, tmp_path, mock_dropbox_client):
     """Test upload of a directory."""
     # Create test directory structure
     test_dir = tmp_path / "test_dir"
     test_dir.mkdir()
     (test_dir / "file1.txt").write_text("content1")
     (test_dir / "file2.txt").write_text("content2")
+    mock_dropbox_client.files_list_folder.return_value = _EMPTY_LISTING
 
-    metadata1 = FileMetadata(
-        name="file1.txt",
-        path_lower="/test_dir/file1.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,  # Use valid hash length
-    )
-    metadata2 = FileMetadata(
-        name="file2.txt",
-        path_lower="/test_dir/file2.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,  # Use valid hash length
-    )
-
-    with patch.object(
-        file_ops,
-        "_upload_file",
-        side_effect=[metadata1, metadata2],
-    ):
+    metadata1 = _make_file_metadata("/test_dir/file1.txt")
+    metadata2 = _make_file_metadata("/test_dir/file2.txt")
+
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.return_value = (
+        UploadSessionFinishBatchResult(
+            entries=[
+                UploadSessionFinishBatchResultEntry.success(metadata1),
+                UploadSessionFinishBatchResultEntry.success(metadata2),
+            ]
+        )
+    )
+
+    result = file_ops.upload(str(test_dir), "/test_dir")
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 2
+    assert list(result["name"]) == ["file1.txt", "file2.txt"]
+
+    # Each file goes up in its own closed session, committed in one batch
+    assert mock_dropbox_client.files_upload_session_start.call_count == 2
+    mock_dropbox_client.files_upload_session_finish_batch_v2.assert_called_once()
+    entries = mock_dropbox_client.files_upload_session_finish_batch_v2.call_args[0][0]
+    assert len(entries) == 2
+    # Dropbox paths use forward slashes whatever the local separator
+    assert [entry.commit.path for entry in entries] == [
+        "/test_dir/file1.txt",
+        "/test_dir/file2.txt",
+    ]
+    assert [entry.cursor.offset for entry in entries] == [8, 8]
+    # Sessions start concurrently, so compare hashes regardless of order
+    assert sorted(
+        call.kwargs["content_hash"]
+        for call in mock_dropbox_client.files_upload_session_start.call_args_list
+    ) == sorted([_content_hash(b"content1"), _content_hash(b"content2")])
+    mock_dropbox_client.files_upload.assert_not_called()
+
+
+def test_scan_files(tmp_path):
+    """Test _scan_files walks nested directories and reports sizes."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_text("abc")
+    (tmp_path / "sub" / "b.txt").write_text("hello")
+
+    assert sorted(_scan_files(str(tmp_path))) == [
+        (str(tmp_path / "a.txt"), 3),
+        (str(tmp_path / "sub" / "b.txt"), 5),
+    ]
+
+
+def test_scan_files_symlinks(tmp_path):
+    """Test _scan_files includes symlinked files but not symlinked directories."""
+    root = tmp_path / "root"
+    (root / "sub").mkdir(parents=True)
+    (root / "sub" / "b.txt").write_text("hello")
+    (tmp_path / "real.txt").write_text("abc")
+    try:
+        (root / "link.txt").symlink_to(tmp_path / "real.txt")
+        (root / "linked_dir").symlink_to(root / "sub", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported")
+
+    assert sorted(_scan_files(str(root))) == [
+        (str(root / "link.txt"), 3),
+        (str(root / "sub" / "b.txt"), 5),
+    ]
+
+
+def test_upload_directory_large_file(
+    file_ops, tmp_path, mock_dropbox_client, monkeypatch
+):
+    """Test large files in a directory bypass the batch upload."""
+    monkeypatch.setattr(file_ops, "LARGE_FILE_THRESHOLD", 8)
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "large.txt").write_bytes(b"012345678")
+    mock_dropbox_client.files_list_folder.return_value = _EMPTY_LISTING
+    metadata = _make_file_metadata("/test_dir/large.txt", size=9)
+
+    with patch.object(file_ops, "_upload_file", return_value=metadata) as mock_upload:
         result = file_ops.upload(str(test_dir), "/test_dir")
-        assert isinstance(result, pd.DataFrame)
-        assert len(result) == 2
+
+    assert len(result) == 1
+    mock_upload.assert_called_once()
+    mock_dropbox_client.files_upload_session_finish_batch_v2.assert_not_called()
+
+
+def test_upload_directory_batch_failure(file_ops, tmp_path, mock_dropbox_client):
+    """Test a rejected batch entry raises UploadError."""
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "file1.txt").write_text("content1")
+    mock_dropbox_client.files_list_folder.return_value = _EMPTY_LISTING
+
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.return_value = (
+        UploadSessionFinishBatchResult(
+            entries=[
+                UploadSessionFinishBatchResultEntry.failure(
+                    UploadSessionFinishError.too_many_write_operations
+                )
+            ]
+        )
+    )
+
+    with pytest.raises(UploadError, match="file1.txt"):
+        file_ops.upload(str(test_dir), "/test_dir")
+
+
+def test_upload_directory_batch_result_mismatch(
+    file_ops, tmp_path, mock_dropbox_client
+):
+    """Test a batch result missing entries raises instead of dropping files."""
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "file1.txt").write_text("content1")
+    (test_dir / "file2.txt").write_text("content2")
+    mock_dropbox_client.files_list_folder.return_value = _EMPTY_LISTING
+
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.return_value = (
+        UploadSessionFinishBatchResult(
+            entries=[
+                UploadSessionFinishBatchResultEntry.success(
+                    _make_file_metadata("/test_dir/file1.txt")
+                )
+            ]
+        )
+    )
+
+    with pytest.raises(UploadError, match="1 results for 2 files"):
+        file_ops.upload(str(test_dir), "/test_dir")
+
+
+def _content_hash(content: bytes) -> str:
+    """Dropbox content hash of a payload smaller than one block."""
+    return hashlib.sha256(hashlib.sha256(content).digest()).hexdigest()
+
+
+def _lookup_error(error_cls, reason) -> dropbox.exceptions.ApiError:
+    return dropbox.exceptions.ApiError(
+        request_id="test_id",
+        error=error_cls.path(reason),
+        user_message_text="Test error",
+        user_message_locale="en",
+    )
+
+
+def test_upload_skips_unchanged(file_ops, test_file, mock_dropbox_client):
+    """Test a file matching the remote size and content hash is not uploaded."""
+    metadata = _make_file_metadata(
+        "/test.txt", size=len(_TEST_CONTENT), content_hash=_content_hash(_TEST_CONTENT)
+    )
+    mock_dropbox_client.files_get_metadata.return_value = metadata
+
+    result = file_ops.upload(str(test_file), "/test.txt")
+
+    assert result.iloc[0]["hash"] == metadata.content_hash
+    mock_dropbox_client.files_upload.assert_not_called()
+
+
+def test_upload_ignores_cached_metadata(file_ops, test_file, mock_dropbox_client):
+    """Test the unchanged-file check does not trust stale cached metadata."""
+    stale = _make_file_metadata(
+        "/test.txt", size=len(_TEST_CONTENT), content_hash=_content_hash(_TEST_CONTENT)
+    )
+    current = _make_file_metadata("/test.txt", size=len(_TEST_CONTENT))
+    mock_dropbox_client.files_get_metadata.return_value = stale
+    file_ops._get_metadata_cached("/test.txt")
+    mock_dropbox_client.files_get_metadata.return_value = current
+
+    file_ops.upload(str(test_file), "/test.txt", overwrite=True)
+
+    mock_dropbox_client.files_upload.assert_called_once()
+
+
+def test_upload_not_found_uploads(file_ops, test_file, mock_dropbox_client):
+    """Test a missing remote file is uploaded."""
+    mock_dropbox_client.files_get_metadata.side_effect = _lookup_error(
+        GetMetadataError, dropbox.files.LookupError.not_found
+    )
+
+    file_ops.upload(str(test_file), "/test.txt")
+
+    mock_dropbox_client.files_upload.assert_called_once()
+
+
+def test_upload_lookup_error_raises(file_ops, test_file, mock_dropbox_client):
+    """Test lookup errors other than not_found are not swallowed."""
+    mock_dropbox_client.files_get_metadata.side_effect = _lookup_error(
+        GetMetadataError, dropbox.files.LookupError.restricted_content
+    )
+
+    with pytest.raises(dropbox.exceptions.ApiError):
+        file_ops.upload(str(test_file), "/test.txt")
+    mock_dropbox_client.files_upload.assert_not_called()
+
+
+def test_upload_directory_skips_unchanged(file_ops, tmp_path, mock_dropbox_client):
+    """Test only changed files in a directory are uploaded."""
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "file1.txt").write_text("content1")
+    (test_dir / "file2.txt").write_text("content2")
+
+    unchanged = _make_file_metadata(
+        "/test_dir/file1.txt", size=8, content_hash=_content_hash(b"content1")
+    )
+    uploaded = _make_file_metadata(
+        "/test_dir/file2.txt", size=8, content_hash=_content_hash(b"content2")
+    )
+    mock_dropbox_client.files_list_folder.return_value = ListFolderResult(
+        entries=[unchanged], cursor="cursor", has_more=False
+    )
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.return_value = (
+        UploadSessionFinishBatchResult(
+            entries=[UploadSessionFinishBatchResultEntry.success(uploaded)]
+        )
+    )
+
+    result = file_ops.upload(str(test_dir), "/test_dir")
+
+    assert list(result["name"]) == ["file1.txt", "file2.txt"]
+    entries = mock_dropbox_client.files_upload_session_finish_batch_v2.call_args[0][0]
+    assert [entry.commit.path for entry in entries] == ["/test_dir/file2.txt"]
+
+
+def test_upload_directory_missing_remote(
+    file_ops, tmp_path, mock_dropbox_client, caplog
+):
+    """Test a missing destination folder only skips the pre-listing."""
+    test_dir = tmp_path / "test_dir"
+    test_dir.mkdir()
+    (test_dir / "file1.txt").write_text("content1")
+    mock_dropbox_client.files_list_folder.side_effect = _lookup_error(
+        ListFolderError, dropbox.files.LookupError.not_found
+    )
+    mock_dropbox_client.files_upload_session_start.return_value = MagicMock(
+        session_id="test_session"
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.return_value = (
+        UploadSessionFinishBatchResult(
+            entries=[
+                UploadSessionFinishBatchResultEntry.success(
+                    _make_file_metadata("/test_dir/file1.txt")
+                )
+            ]
+        )
+    )
+
+    result = file_ops.upload(str(test_dir), "/test_dir")
+    assert len(result) == 1
+    assert "ERROR" not in caplog.text
+
+    mock_dropbox_client.files_list_folder.side_effect = _lookup_error(
+        ListFolderError, dropbox.files.LookupError.restricted_content
+    )
+    with pytest.raises(dropbox.exceptions.ApiError):
+        file_ops.upload(str(test_dir), "/test_dir")
+
+
+def test_upload_directory_lists_target_folders(file_ops, tmp_path, mock_dropbox_client):
+    """Test only the folders written to are listed, not the whole destination."""
+    test_dir = tmp_path / "test_dir"
+    (test_dir / "sub").mkdir(parents=True)
+    (test_dir / "file1.txt").write_text("content1")
+    (test_dir / "sub" / "file2.txt").write_text("content2")
+    unchanged = [
+        _make_file_metadata(
+            "/file1.txt", size=8, content_hash=_content_hash(b"content1")
+        ),
+        _make_file_metadata(
+            "/sub/file2.txt", size=8, content_hash=_content_hash(b"content2")
+        ),
+    ]
+    mock_dropbox_client.files_list_folder.side_effect = [
+        ListFolderResult(entries=unchanged[:1], cursor="cursor", has_more=False),
+        ListFolderResult(entries=unchanged[1:], cursor="cursor", has_more=False),
+    ]
+
+    result = file_ops.upload(str(test_dir), "/")
+
+    assert list(result["name"]) == ["file1.txt", "file2.txt"]
+    assert [
+        call.args[0] for call in mock_dropbox_client.files_list_folder.call_args_list
+    ] == ["", "/sub"]
+    assert all(
+        "recursive" not in call.kwargs
+        for call in mock_dropbox_client.files_list_folder.call_args_list
+    )
+    mock_dropbox_client.files_upload_session_finish_batch_v2.assert_not_called()
 
 
 def test_download_file(file_ops, tmp_path, mock_dropbox_client):
     """Test downloading a single file."""
     local_path = tmp_path / "downloaded.txt"
-    metadata = FileMetadata(
-        name="test.txt",
-        path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,
-    )
+    metadata = _make_file_metadata("/test.txt")
 
-    mock_response = MagicMock()
-    mock_response.iter_content.return_value = [b"test content"]
-    mock_dropbox_client.files_download.return_value = (metadata, mock_response)
-    mock_dropbox_client.files_get_metadata.return_value = FileMetadata(
-        name="test.txt",
-        path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,
-    )
+    response = _StreamResp()
+    mock_dropbox_client.files_download.return_value = (metadata, response)
+    mock_dropbox_client.files_get_metadata.return_value = metadata
 
     result = file_ops._download_file("/test.txt", str(local_path))
     assert isinstance(result, FileMetadata)
     assert result.name == "test.txt"
     assert local_path.exists()
-    assert local_path.read_text() == "test content"
+    assert local_path.read_bytes() == _TEST_CONTENT
+    # Transfer encodings are decoded, as requests' iter_content would
+    assert response.raw.decode_content is True
+    assert response.closed
+
+
+def test_download_single_file_metadata_cached(
+    file_ops, tmp_path, mock_dropbox_client
+):
+    """Test a single-file download looks up metadata once."""
+    metadata = _make_file_metadata("/test.txt", size=len(_TEST_CONTENT))
+    mock_dropbox_client.files_get_metadata.return_value = metadata
+    mock_dropbox_client.files_download.return_value = (metadata, _StreamResp())
+
+    result = file_ops.download("/test.txt", str(tmp_path / "test.txt"))
+    assert len(result) == 1
+    mock_dropbox_client.files_get_metadata.assert_called_once_with("/test.txt")
 
 
 def test_download_large_file(file_ops, tmp_path, mock_dropbox_client):
     """Test downloading a large file."""
     local_path = tmp_path / "downloaded_large.txt"
-    metadata = FileMetadata(
-        name="large.txt",
-        path_lower="/large.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=200 * 1024 * 1024,
-        content_hash="a" * 64,
-    )
+    metadata = _make_file_metadata("/large.txt", size=200 * 1024 * 1024)
 
     # Setup mock properly
     mock_dropbox_client.files_get_metadata.return_value = metadata
     mock_dropbox_client.files_download_session_start.return_value = (
         metadata,
-        MagicMock(content=b"test content", session_id="test_session"),
+        MagicMock(content=_ZERO_CHUNK, session_id="test_session"),
+    )
+    # Later chunks come from a generator over the shared buffer, so no
+    # payload is held beyond one chunk; a short chunk ends the session
+    mock_dropbox_client.files_download_session_append.side_effect = (
+        MagicMock(content=content, session_id="test_session")
+        for content in (_ZERO_CHUNK, _TEST_CONTENT)
     )
 
     result = file_ops._download_large_file("/large.txt", str(local_path))
     assert isinstance(result, FileMetadata)
+    assert mock_dropbox_client.files_download_session_append.call_count == 2
+    assert local_path.stat().st_size == 2 * file_ops.CHUNK_SIZE + len(_TEST_CONTENT)
 
 
 def test_download_directory(file_ops, tmp_path, mock_dropbox_client):
@@ -248,44 +587,20 @@ def test_download_directory(file_ops, tmp_path, mock_dropbox_client):
         name="test_dir", path_lower="/test_dir", id="id123"
     )
     local_dir = tmp_path / "download_dir"
-    metadata1 = FileMetadata(
-        name="file1.txt",
-        path_lower="/test_dir/file1.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,  # Use valid hash length
-    )
-    metadata2 = FileMetadata(
-        name="file2.txt",
-        path_lower="/test_dir/file2.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=100,
-        content_hash="a" * 64,  # Use valid hash length
-    )
+    metadata1 = _make_file_metadata("/test_dir/file1.txt")
+    metadata2 = _make_file_metadata("/test_dir/file2.txt")
 
     # Mock list_files to return our test files
-    mock_dropbox_client.files_get_metadata = MagicMock(
-        return_value=MagicMock(is_file=False)
-    )
-    file_ops.list_files = MagicMock(
-        return_value=pd.DataFrame(
-            [
-                file_ops._process_metadata(metadata1),
-                file_ops._process_metadata(metadata2),
-            ]
-        )
-    )
+    mock_files = file_ops._process_metadata_batch([metadata1, metadata2])
 
     # Mock _download_file to simulate file downloads
-    file_ops._download_file = MagicMock(side_effect=[metadata1, metadata2])
-
-    mock_dropbox_client.files_get_metadata.return_value = FolderMetadata(
-        name="test_dir", path_lower="/test_dir", id="id123"
-    )
-
-    result = file_ops.download("/test_dir", str(local_dir))
+    with patch.object(file_ops, "list_files", return_value=mock_files), patch.object(
+        file_ops, "_download_file", side_effect=[metadata1, metadata2]
+    ):
+        result = file_ops.download("/test_dir", str(local_dir))
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 2
+    assert mock_dropbox_client.files_get_metadata.call_count == 1
 
 
 def test_upload_error_handling(file_ops, test_file, mock_dropbox_client):
@@ -307,7 +622,8 @@ def test_download_error_handling(file_ops, tmp_path, mock_dropbox_client):
 def test_large_file_upload_session_error(file_ops, tmp_path, mock_dropbox_client):
     """Test error handling in large file upload session."""
     large_file = tmp_path / "large.txt"
-    large_file.write_bytes(b"0" * (150 * 1024 * 1024 + 1))  # Slightly over 150MB
+    with open(large_file, "wb") as f:
+        f.truncate(150 * 1024 * 1024 + 1)  # Sparse file, slightly over 150MB
 
     mock_dropbox_client.files_upload_session_start.return_value = MagicMock(session_id="test_session")
     mock_dropbox_client.files_upload_session_append_v2.side_effect = Exception("Session error")
@@ -319,13 +635,7 @@ def test_large_file_upload_session_error(file_ops, tmp_path, mock_dropbox_client
 def test_large_file_download_session_error(file_ops, tmp_path, mock_dropbox_client):
     """Test error handling in large file download session."""
     local_path = tmp_path / "large.txt"
-    metadata = FileMetadata(
-        name="large.txt",
-        path_lower="/large.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=200 * 1024 * 1024,  # 200MB
-        content_hash="a" * 64,
-    )
+    metadata = _make_file_metadata("/large.txt", size=200 * 1024 * 1024)
 
     mock_dropbox_client.files_get_metadata.return_value = metadata
     mock_dropbox_client.files_download_session_start.side_effect = Exception("Session error")
@@ -334,15 +644,19 @@ def test_large_file_download_session_error(file_ops, tmp_path, mock_dropbox_clie
         file_ops._download_large_file("/large.txt", str(local_path))
 
 
-def test_directory_upload_error(file_ops, tmp_path):
+def test_directory_upload_error(file_ops, tmp_path, mock_dropbox_client):
     """Test error handling during directory upload."""
     test_dir = tmp_path / "test_dir"
     test_dir.mkdir()
     (test_dir / "file1.txt").write_text("content1")
+    mock_dropbox_client.files_list_folder.return_value = _EMPTY_LISTING
 
-    with patch.object(file_ops, "_upload_file", side_effect=Exception("Upload failed")):
-        with pytest.raises(Exception):
-            file_ops.upload(str(test_dir), "/test_dir")
+    mock_dropbox_client.files_upload_session_start.side_effect = Exception(
+        "Upload failed"
+    )
+
+    with pytest.raises(Exception):
+        file_ops.upload(str(test_dir), "/test_dir")
 
 
 def test_directory_download_error(file_ops, tmp_path, mock_dropbox_client):
@@ -351,18 +665,18 @@ def test_directory_download_error(file_ops, tmp_path, mock_dropbox_client):
         name="test_dir", path_lower="/test_dir", id="id123"
     )
     
-    file_ops.list_files = MagicMock(
-        return_value=pd.DataFrame([{
-            "name": "file1.txt",
-            "path": "/test_dir/file1.txt",
-            "type": "file",
-            "size": 100,
-            "modified": "2023-01-01T00:00:00Z",
-            "hash": "a" * 64,
-        }])
-    )
-    
-    with patch.object(file_ops, "_download_file", side_effect=Exception("Download failed")):
+    mock_files = pd.DataFrame([{
+        "name": "file1.txt",
+        "path": "/test_dir/file1.txt",
+        "type": "file",
+        "size": 100,
+        "modified": "2023-01-01T00:00:00Z",
+        "hash": FAKE_HASH,
+    }])
+
+    with patch.object(file_ops, "list_files", return_value=mock_files), patch.object(
+        file_ops, "_download_file", side_effect=Exception("Download failed")
+    ):
         with pytest.raises(Exception):
             file_ops.download("/test_dir", str(tmp_path / "download_dir"))
 
@@ -371,16 +685,11 @@ def test_upload_session_append(file_ops, tmp_path, mock_dropbox_client):
     """Test upload session append for large files."""
     large_file = tmp_path / "large.txt"
     file_size = 200 * 1024 * 1024  # 200MB
-    large_file.write_bytes(b"0" * file_size)
+    with open(large_file, "wb") as f:
+        f.truncate(file_size)  # Sparse file, no payload allocated
 
     session_id = "test_session"
-    metadata = FileMetadata(
-        name="large.txt",
-        path_lower="/large.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=file_size,
-        content_hash="a" * 64,
-    )
+    metadata = _make_file_metadata("/large.txt", size=file_size)
 
     mock_dropbox_client.files_upload_session_start.return_value = MagicMock(session_id=session_id)
     mock_dropbox_client.files_upload_session_finish.return_value = metadata
@@ -389,26 +698,48 @@ def test_upload_session_append(file_ops, tmp_path, mock_dropbox_client):
     assert isinstance(result, FileMetadata)
     assert mock_dropbox_client.files_upload_session_append_v2.call_count > 0
 
+    # Each request carries the Dropbox content hash of its own chunk only:
+    # SHA256 over the SHA256 of the chunk's single 4MB block
+    chunk_hash = hashlib.sha256(
+        hashlib.sha256(_ZERO_CHUNK[:HASH_BLOCK_SIZE]).digest()
+    ).hexdigest()
+    start_kwargs = mock_dropbox_client.files_upload_session_start.call_args.kwargs
+    assert start_kwargs["content_hash"] == chunk_hash
+    for append in mock_dropbox_client.files_upload_session_append_v2.call_args_list:
+        assert append.kwargs["content_hash"] == chunk_hash
+    finish_kwargs = mock_dropbox_client.files_upload_session_finish.call_args.kwargs
+    assert finish_kwargs["content_hash"] == chunk_hash
+
+
+def test_content_hasher_partial_blocks():
+    """Test the content hash does not depend on how data is chunked."""
+    data = bytes(range(256)) * (HASH_BLOCK_SIZE // 128 + 3)  # 2 blocks + tail
+    expected = hashlib.sha256(
+        b"".join(
+            hashlib.sha256(data[i : i + HASH_BLOCK_SIZE]).digest()
+            for i in range(0, len(data), HASH_BLOCK_SIZE)
+        )
+    ).hexdigest()
+
+    hasher = _ContentHasher()
+    for i in range(0, len(data), 3 * 1024 * 1024):
+        hasher.update(data[i : i + 3 * 1024 * 1024])
+    assert hasher.hexdigest() == expected
+
 
 def test_download_session_append(file_ops, tmp_path, mock_dropbox_client):
     """Test download session append for large files."""
     local_path = tmp_path / "large.txt"
-    metadata = FileMetadata(
-        name="large.txt",
-        path_lower="/large.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
-        size=200 * 1024 * 1024,  # 200MB
-        content_hash="a" * 64,
-    )
+    metadata = _make_file_metadata("/large.txt", size=200 * 1024 * 1024)
 
     mock_dropbox_client.files_get_metadata.return_value = metadata
     mock_session_result = MagicMock(
-        content=b"0" * file_ops.CHUNK_SIZE,
+        content=_ZERO_CHUNK,
         session_id="test_session"
     )
     mock_dropbox_client.files_download_session_start.return_value = (metadata, mock_session_result)
     mock_dropbox_client.files_download_session_append.return_value = MagicMock(
-        content=b"0" * (file_ops.CHUNK_SIZE // 2),  # Last chunk smaller to end session
+        content=_ZERO_CHUNK[: file_ops.CHUNK_SIZE // 2],  # Last chunk ends session
         session_id="test_session"
     )
 
@@ -1,32 +1,57 @@
 """Tests for the folder operations module."""
 
-from datetime import datetime, timezone
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
 import dropbox
 import pandas as pd
 import pytest
-from dropbox import Dropbox
 from dropbox.files import FileMetadata, FolderMetadata
 
 from nova_pydrobox.operations.base import FileFilter
 from nova_pydrobox.operations.folders import FolderOperations
+from tests.operations.conftest import FAKE_HASH, FIXED_TS
 
+# Dropbox client methods reached by FolderOperations
+_CLIENT_METHODS = [
+    "files_create_folder_v2",
+    "files_get_metadata",
+    "files_list_folder",
+    "files_list_folder_continue",
+]
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_dropbox_client() -> Generator[MagicMock, None, None]:
-    """Create a mock Dropbox client."""
-    client = MagicMock(spec=Dropbox)
+    """Create a mock Dropbox client shared by the module."""
+    # A name-list spec still rejects unknown attributes without scanning Dropbox
+    client = MagicMock(spec=_CLIENT_METHODS)
     yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def folder_ops(mock_dropbox_client: MagicMock) -> FolderOperations:
     """Create a FolderOperations instance with mock client."""
     return FolderOperations(dbx_client=mock_dropbox_client)
 
 
+@pytest.fixture(scope="module")
+def mock_files_df() -> pd.DataFrame:
+    """Folder listing shared by list_files-based tests; tests must not modify it."""
+    return pd.DataFrame(
+        {
+            "name": ["file1.txt", "file2.txt", "subfolder"],
+            "path": [
+                "/test_folder/file1.txt",
+                "/test_folder/file2.txt",
+                "/test_folder/subfolder",
+            ],
+            "type": ["file", "file", "folder"],
+            "size": [100, 200, 0],
+        }
+    )
+
+
 def test_create_folder(
     folder_ops: FolderOperations, mock_dropbox_client: MagicMock
 ) -> None:
@@ -50,55 +75,24 @@ def test_create_folder(
     mock_dropbox_client.files_create_folder_v2.assert_called_once_with("/test_folder")
 
 
-def test_get_folder_size(folder_ops: FolderOperations) -> None:
+def test_get_folder_size(
+    folder_ops: FolderOperations, mock_files_df: pd.DataFrame
+) -> None:
     """Test getting folder size."""
-    mock_files = pd.DataFrame(
-        [
-            {
-                "name": "file1.txt",
-                "path": "/test_folder/file1.txt",
-                "type": "file",
-                "size": 100,
-            },
-            {
-                "name": "file2.txt",
-                "path": "/test_folder/file2.txt",
-                "type": "file",
-                "size": 200,
-            },
-        ]
-    )
-
-    with patch.object(folder_ops, "list_files", return_value=mock_files):
+    with patch.object(folder_ops, "list_files", return_value=mock_files_df):
         size = folder_ops.get_folder_size("/test_folder")
         assert size == 300
 
 
-def test_get_folder_structure(folder_ops: FolderOperations) -> None:
+def test_get_folder_structure(
+    folder_ops: FolderOperations, mock_files_df: pd.DataFrame
+) -> None:
     """Test getting folder structure."""
-    mock_files = pd.DataFrame(
-        [
-            {
-                "name": "file1.txt",
-                "path": "/test_folder/file1.txt",
-                "type": "file",
-                "size": 100,
-            },
-            {
-                "name": "subfolder",
-                "path": "/test_folder/subfolder",
-                "type": "folder",
-                "size": 0,
-            },
-        ]
-    )
-
-    with patch.object(folder_ops, "list_files", return_value=mock_files):
+    with patch.object(folder_ops, "list_files", return_value=mock_files_df):
         result = folder_ops.get_folder_structure("/test_folder")
         assert isinstance(result, pd.DataFrame)
-        assert len(result) == 2
-        assert result.iloc[0]["type"] == "file"
-        assert result.iloc[1]["type"] == "folder"
+        assert len(result) == 3
+        assert list(result["type"]) == ["file", "file", "folder"]
 
 
 def test_is_empty_true(folder_ops: FolderOperations) -> None:
@@ -107,20 +101,11 @@ def test_is_empty_true(folder_ops: FolderOperations) -> None:
         assert folder_ops.is_empty("/test_folder") is True
 
 
-def test_is_empty_false(folder_ops: FolderOperations) -> None:
+def test_is_empty_false(
+    folder_ops: FolderOperations, mock_files_df: pd.DataFrame
+) -> None:
     """Test checking if folder is empty (false case)."""
-    mock_files = pd.DataFrame(
-        [
-            {
-                "name": "file1.txt",
-                "path": "/test_folder/file1.txt",
-                "type": "file",
-                "size": 100,
-            }
-        ]
-    )
-
-    with patch.object(folder_ops, "list_files", return_value=mock_files):
+    with patch.object(folder_ops, "list_files", return_value=mock_files_df):
         assert folder_ops.is_empty("/test_folder") is False
 
 
@@ -138,17 +123,31 @@ def test_get_folder_metadata(
     assert result.iloc[0]["type"] == "folder"
 
 
+def test_get_folder_metadata_no_cache(
+    folder_ops: FolderOperations, mock_dropbox_client: MagicMock
+) -> None:
+    """Test use_cache=False bypasses a cached lookup."""
+    stale = FolderMetadata(name="old", path_lower="/test_folder", id="id123")
+    current = FolderMetadata(name="new", path_lower="/test_folder", id="id123")
+    mock_dropbox_client.files_get_metadata.return_value = stale
+    folder_ops.get_folder_metadata("/test_folder")
+    mock_dropbox_client.files_get_metadata.return_value = current
+
+    assert folder_ops.get_folder_metadata("/test_folder").iloc[0]["name"] == "old"
+    result = folder_ops.get_folder_metadata("/test_folder", use_cache=False)
+    assert result.iloc[0]["name"] == "new"
+
+
 def test_get_folder_metadata_not_folder(
     folder_ops: FolderOperations, mock_dropbox_client: MagicMock
 ) -> None:
     """Test getting folder metadata for a file (should fail)."""
-    content_hash = "a" * 64
     metadata = FileMetadata(
         name="test.txt",
         path_lower="/test.txt",
-        client_modified=datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc),
+        client_modified=FIXED_TS,
         size=100,
-        content_hash=content_hash,
+        content_hash=FAKE_HASH,
     )
     mock_dropbox_client.files_get_metadata.return_value = metadata
 
@@ -207,69 +206,33 @@ def test_create_folder_error(folder_ops, mock_dropbox_client):
         folder_ops.create_folder("/test_folder")
 
 
-def test_get_folder_size_error(folder_ops, mock_dropbox_client):
-    """Test getting folder size with API error."""
-    mock_dropbox_client.files_list_folder.side_effect = dropbox.exceptions.ApiError(
-        "request_id", "error", user_message_text="Test error", user_message_locale="en"
-    )
-
-    with pytest.raises(dropbox.exceptions.ApiError):
-        folder_ops.get_folder_size("/test_folder")
-
-
-def test_get_folder_structure_error(folder_ops, mock_dropbox_client):
-    """Test getting folder structure with API error."""
-    mock_dropbox_client.files_list_folder.side_effect = dropbox.exceptions.ApiError(
+@pytest.mark.parametrize(
+    "method,mock_attr",
+    [
+        ("get_folder_size", "files_list_folder"),
+        ("get_folder_structure", "files_list_folder"),
+        ("is_empty", "files_list_folder"),
+        ("get_folder_metadata", "files_get_metadata"),
+    ],
+)
+def test_api_error_paths(folder_ops, mock_dropbox_client, method, mock_attr):
+    """Test folder methods re-raise API errors from the client."""
+    getattr(mock_dropbox_client, mock_attr).side_effect = dropbox.exceptions.ApiError(
         "request_id", "error", user_message_text="Test error", user_message_locale="en"
     )
 
     with pytest.raises(dropbox.exceptions.ApiError):
-        folder_ops.get_folder_structure("/test_folder")
+        getattr(folder_ops, method)("/test_folder")
 
 
-def test_is_empty_error(folder_ops, mock_dropbox_client):
-    """Test is_empty method with API error."""
-    mock_dropbox_client.files_list_folder.side_effect = dropbox.exceptions.ApiError(
-        "request_id", "error", user_message_text="Test error", user_message_locale="en"
-    )
-
-    with pytest.raises(dropbox.exceptions.ApiError):
-        folder_ops.is_empty("/test_folder")
-
-
-def test_get_folder_metadata_api_error(folder_ops, mock_dropbox_client):
-    """Test get_folder_metadata with API error."""
-    mock_dropbox_client.files_get_metadata.side_effect = dropbox.exceptions.ApiError(
-        "request_id", "error", user_message_text="Test error", user_message_locale="en"
-    )
-
-    with pytest.raises(dropbox.exceptions.ApiError):
-        folder_ops.get_folder_metadata("/test_folder")
-
-
-def test_get_folder_structure_with_recursive(folder_ops, mock_dropbox_client):
+def test_get_folder_structure_with_recursive(folder_ops, mock_files_df):
     """Test getting folder structure with recursive option."""
-    mock_files = pd.DataFrame(
-        [
-            {
-                "name": "file1.txt",
-                "path": "/test_folder/file1.txt",
-                "type": "file",
-                "size": 100,
-            },
-            {
-                "name": "subfolder",
-                "path": "/test_folder/subfolder",
-                "type": "folder",
-                "size": 0,
-            },
-        ]
-    )
-
-    with patch.object(folder_ops, "list_files", return_value=mock_files) as mock_list:
+    with patch.object(
+        folder_ops, "list_files", return_value=mock_files_df
+    ) as mock_list:
         result = folder_ops.get_folder_structure("/test_folder")
         assert isinstance(result, pd.DataFrame)
-        assert len(result) == 2
+        assert len(result) == 3
         mock_list.assert_called_once_with(
             "/test_folder", 
             filter_criteria=FileFilter(recursive=True)
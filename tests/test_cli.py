@@ -1,16 +1,38 @@
 # tests/test_cli.py
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
-from nova_pydrobox.cli import authenticate, cli, list_files
+from nova_pydrobox.auth import Authenticator
+from nova_pydrobox.cli import _normalize_path, authenticate, cli, list_files
 
 
-@pytest.fixture(autouse=True)
-def mock_token_storage(mocker):
-    """Mock TokenStorage to prevent keychain access during tests."""
-    return mocker.patch("nova_pydrobox.auth.TokenStorage")
+class _FakeTokenStorage:
+    """In-process TokenStorage stand-in returning fixed credentials."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_tokens(self):
+        return {"app_key": "test", "app_secret": "test", "refresh_token": "test"}
+
+    def save_tokens(self, *args, **kwargs):
+        return True
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_token_storage():
+    """Swap in a fake TokenStorage to prevent keychain access during tests."""
+    # Patch the name Authenticator looks up, not the package re-export
+    with patch("nova_pydrobox.auth.authenticator.TokenStorage", _FakeTokenStorage):
+        yield _FakeTokenStorage
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CliRunner shared by the module; invoke() isolates each call."""
+    return CliRunner()
 
 
 @pytest.fixture
@@ -22,36 +44,38 @@ def mock_dropbox_flow(mocker):
     return mock_flow
 
 
-def test_cli_group():
+def test_token_storage_is_faked():
+    """Test Authenticator picks up the fake TokenStorage."""
+    assert isinstance(Authenticator().storage, _FakeTokenStorage)
+
+
+def test_cli_group(runner):
     """Test CLI group base command."""
-    runner = CliRunner()
     result = runner.invoke(cli)
     assert result.exit_code == 0
 
 
 @pytest.mark.parametrize("command", [authenticate, list_files])
-def test_cli_commands_help(command):
+def test_cli_commands_help(runner, command):
     """Test help output for CLI commands."""
-    runner = CliRunner()
     result = runner.invoke(command, ["--help"])
     assert result.exit_code == 0
     assert "Usage:" in result.output
 
 
-def test_authenticate_command(mocker):
+def test_authenticate_command(runner, mocker):
     """Test authenticate command."""
     mock_auth_class = mocker.patch("nova_pydrobox.cli.Authenticator")
     mock_auth_instance = mock_auth_class.return_value
     mock_auth_instance.authenticate_dropbox.return_value = True
 
-    runner = CliRunner()
     result = runner.invoke(authenticate)
 
     assert result.exit_code == 0
     mock_auth_instance.authenticate_dropbox.assert_called_once()
 
 
-def test_list_files_command(mocker):
+def test_list_files_command(runner, mocker):
     """Test list_files command."""
     # Create a mock file object
     mock_file = MagicMock()
@@ -63,14 +87,7 @@ def test_list_files_command(mocker):
     mock_ops = mocker.patch("nova_pydrobox.cli.FolderOperations")
     mock_ops.return_value.list_files.return_value = [mock_file]
 
-    # Mock token storage
-    mocker.patch(
-        "nova_pydrobox.auth.TokenStorage.get_tokens",
-        return_value={"app_key": "test", "app_secret": "test", "refresh_token": "test"},
-    )
-
-    runner = CliRunner()
-    result = runner.invoke(list_files, ["/test"])
+    result = runner.invoke(list_files, ["/test/"])
 
     # Debug output if needed
     if result.exit_code != 0:
@@ -80,7 +97,23 @@ def test_list_files_command(mocker):
     mock_ops.return_value.list_files.assert_called_once_with("/test")
 
 
-def test_authenticate_dropbox_success(mock_token_storage, mock_dropbox_flow, mocker):
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/", "/"),
+        ("", "/"),
+        ("/test", "/test"),
+        ("/test/", "/test"),
+        ("/test//", "/test"),
+        ("/test/sub/", "/test/sub"),
+    ],
+)
+def test_normalize_path(path, expected):
+    """Test CLI path normalization strips trailing slashes."""
+    assert _normalize_path(path) == expected
+
+
+def test_authenticate_dropbox_success(mock_dropbox_flow, mocker):
     """Test successful Dropbox authentication."""
     # Mock the Authenticator class instead of creating an instance
     mock_auth = mocker.patch("nova_pydrobox.cli.Authenticator")
@@ -90,9 +123,6 @@ def test_authenticate_dropbox_success(mock_token_storage, mock_dropbox_flow, moc
     mock_auth_instance.setup_credentials.return_value = ("test_key", "test_secret")
     mock_auth_instance.authenticate_dropbox.return_value = True
 
-    # Mock token storage
-    mock_token_storage.return_value.save_tokens.return_value = True
-
     # Create mock OAuth result
     mock_result = MagicMock()
     mock_result.access_token = "test_access"
@@ -5,6 +5,11 @@ from tqdm import tqdm
 
 from nova_pydrobox.utils.progress import create_progress_bar, estimate_time, format_size
 
+_KB, _MB, _GB, _TB, _PB, _EB = (1 << 10, 1 << 20, 1 << 30, 1 << 40, 1 << 50, 1 << 60)
+
+_DESC_TESTING = "Testing"
+_DESC_UPLOADING = "Uploading"
+
 
 def test_create_progress_bar():
     """Test progress bar creation with default parameters."""
@@ -20,7 +25,7 @@ def test_create_progress_bar_custom_params():
     """Test progress bar creation with custom parameters."""
     progress_bar = create_progress_bar(
         total=1000,
-        desc="Uploading",
+        desc=_DESC_UPLOADING,
         unit="KB",
         unit_scale=False,
         unit_divisor=1000,
@@ -32,52 +37,55 @@ def test_create_progress_bar_custom_params():
     )
     assert isinstance(progress_bar, tqdm)
     assert progress_bar.total == 1000
-    assert progress_bar.desc == "Uploading"  # Test desc directly
+    assert progress_bar.desc == _DESC_UPLOADING  # Test desc directly
     progress_bar.close()
 
 
-@pytest.mark.parametrize(
-    "size,expected",
-    [
-        (500, "500.00 B"),
-        (1024, "1.00 KB"),
-        (1024 * 1024, "1.00 MB"),
-        (1024 * 1024 * 1024, "1.00 GB"),
-        (1024 * 1024 * 1024 * 1024, "1.00 TB"),
-        (1024 * 1024 * 1024 * 1024 * 1024, "1.00 PB"),
-    ],
-)
-def test_format_size(size, expected):
-    """Test size formatting for various sizes."""
-    assert format_size(size) == expected
-
-
-def test_format_size_zero():
-    """Test size formatting for zero bytes."""
-    assert format_size(0) == "0.00 B"
-
-
-def test_format_size_small():
-    """Test size formatting for small values."""
-    assert format_size(10) == "10.00 B"
+_FORMAT_SIZE_CASES = {
+    0: "0.00 B",
+    10: "10.00 B",
+    500: "500.00 B",
+    _KB: "1.00 KB",
+    1536: "1.50 KB",  # Fractional
+    _MB: "1.00 MB",
+    _GB: "1.00 GB",
+    _TB: "1.00 TB",
+    _PB: "1.00 PB",
+    _MB - 1: "1024.00 KB",  # Rounds up within its unit
+    _EB: "1024.00 PB",  # Largest unit caps the scale
+}
 
 
-def test_format_size_fractional():
-    """Test size formatting for fractional values."""
-    assert format_size(1536) == "1.50 KB"  # 1.5 KB
+def test_format_size():
+    """Test size formatting for various sizes."""
+    # Comparing dicts keeps each mismatching size visible in the diff
+    results = {size: format_size(size) for size in _FORMAT_SIZE_CASES}
+    assert results == _FORMAT_SIZE_CASES
+
+
+def test_format_size_cached():
+    """Test repeated sizes are served from the cache."""
+    size = 4 * _MB + 1
+    first = format_size(size)
+    hits = format_size.cache_info().hits
+    assert format_size(size) is first
+    assert format_size.cache_info().hits == hits + 1
+
+
+_ESTIMATE_CASES = (
+    (1000, 100, 0, "10s"),  # 10 seconds
+    (1000, 10, 0, "100s"),  # 100 seconds
+    (3600, 1, 0, "1.0h"),  # 1 hour
+    (7200, 1, 0, "2.0h"),  # 2 hours
+    (1000, 100, 500, "5s"),  # 5 seconds with partial completion
+    (1000, 0, 0, "unknown"),  # Zero speed
+    (1000, -1, 0, "unknown"),  # Negative speed
+    (1000, 100, 1500, "0s"),  # Overshoot never goes negative
+    (3599, 1, 0, "3599s"),  # Just under an hour stays in seconds
+)
 
 
-@pytest.mark.parametrize(
-    "total,speed,completed,expected",
-    [
-        (1000, 100, 0, "10s"),  # 10 seconds
-        (1000, 10, 0, "100s"),  # 100 seconds
-        (3600, 1, 0, "1.0h"),  # 1 hour
-        (7200, 1, 0, "2.0h"),  # 2 hours
-        (1000, 100, 500, "5s"),  # 5 seconds with partial completion
-        (1000, 0, 0, "unknown"),  # Zero speed
-    ],
-)
+@pytest.mark.parametrize("total,speed,completed,expected", _ESTIMATE_CASES)
 def test_estimate_time(total, speed, completed, expected):
     """Test time estimation for various scenarios."""
     assert estimate_time(total, speed, completed) == expected
@@ -95,7 +103,7 @@ def test_estimate_time_zero_remaining():
 
 def test_progress_bar_updates():
     """Test progress bar updates correctly."""
-    with create_progress_bar(total=100, desc="Testing") as pbar:
+    with create_progress_bar(total=100, desc=_DESC_TESTING) as pbar:
         assert pbar.n == 0
         pbar.update(50)
         assert pbar.n == 50
@@ -112,11 +120,25 @@ def test_progress_bar_context_manager():
     assert pbar.n == pbar.total
 
 
-def test_progress_bar_disable():
+def test_progress_bar_disable(mocker):
     """Test progress bar can be disabled."""
+    mock_tqdm = mocker.patch("nova_pydrobox.utils.progress.tqdm")
+
     progress_bar = create_progress_bar(total=100, disable=True)
-    assert progress_bar.disable is True
-    progress_bar.close()
+
+    assert progress_bar is mock_tqdm.return_value
+    mock_tqdm.assert_called_once_with(
+        total=100,
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        disable=True,
+        leave=True,
+        initial=0,
+        miniters=1,
+        dynamic_ncols=True,
+    )
+    progress_bar.set_description_str.assert_called_once_with("")
 
 
 def test_progress_bar_unit_conversion():
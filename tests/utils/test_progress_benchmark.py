@@ -0,0 +1,37 @@
+"""Performance regression guards for the progress utilities module."""
+
+import pytest
+
+from nova_pydrobox.utils.progress import estimate_time, format_size
+
+pytest.importorskip("pytest_benchmark")
+
+# Wall-clock ceilings are skewed by coverage tracing, so these run in their
+# own CI step (pytest -m perf --no-cov) rather than in the default suite
+pytestmark = pytest.mark.perf
+
+# Generous ceilings that a regression to per-call logging or I/O still fails
+_FORMAT_SIZE_MAX_MEAN = 5e-6
+_ESTIMATE_TIME_MAX_MEAN = 5e-6
+
+
+def _assert_mean_below(benchmark, limit):
+    """Assert the benchmark mean is under limit when timings were taken."""
+    # Benchmarks are disabled under xdist or --benchmark-disable
+    if not benchmark.disabled:
+        assert benchmark.stats.stats.mean < limit
+
+
+def test_format_size_perf(benchmark):
+    """Test format_size stays fast when the result is not cached."""
+    # Time the undecorated function; the lru_cache would only measure a lookup
+    result = benchmark(format_size.__wrapped__, 1536 * 1024)
+    assert result == "1.50 MB"
+    _assert_mean_below(benchmark, _FORMAT_SIZE_MAX_MEAN)
+
+
+def test_estimate_time_perf(benchmark):
+    """Test estimate_time stays fast."""
+    result = benchmark(estimate_time, 150 * 1024 * 1024, 4 * 1024 * 1024, 1024)
+    assert result == "37s"
+    _assert_mean_below(benchmark, _ESTIMATE_TIME_MAX_MEAN)